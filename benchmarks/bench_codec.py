@@ -0,0 +1,80 @@
+"""
+Tamaño y velocidad del codec binario frente a pickle y JSON sobre
+registros generados por los propios simuladores de ingesta.
+
+Uso: python benchmarks/bench_codec.py [--n N]
+"""
+import argparse
+import asyncio
+import json
+import os
+import pickle
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from communication import codec
+from communication.records import AnalysisResult
+from ingestion import simulate_biochemical_data_feed, simulate_genetic_data_feed, simulate_physical_data_feed
+from normalization import BiochemicalNormalizer, GeneticNormalizer, PhysicalNormalizer
+
+
+async def _collect(feed, normalizer, n: int):
+    queue = asyncio.Queue()
+    task = asyncio.create_task(feed(queue, 1e9))
+    records = [normalizer.normalize(await queue.get()) for _ in range(n)]
+    task.cancel()
+    return records
+
+
+def _results_for(records):
+    return [
+        AnalysisResult(f"res_{r.sample_id}", r.type, r.sample_id, "Estable",
+                       getattr(r, "source_lab", None), getattr(r, "toxin_level", None), 1500.0)
+        for r in records
+    ]
+
+
+def _measure(records, dumps, loads):
+    start_time = time.perf_counter()
+    payloads = [dumps(r) for r in records]
+    decoded = [loads(p) for p in payloads]
+    elapsed_us = (time.perf_counter() - start_time) / len(records) * 1e6
+    return sum(len(p) for p in payloads) / len(records), elapsed_us, decoded
+
+
+async def run(n: int):
+    genetic = await _collect(simulate_genetic_data_feed, GeneticNormalizer(), n)
+    biochem = await _collect(simulate_biochemical_data_feed, BiochemicalNormalizer(), n)
+    physical = await _collect(simulate_physical_data_feed, PhysicalNormalizer(), n)
+
+    feeds = {
+        "genetic": genetic,
+        "biochemical": biochem,
+        "physical": physical,
+        "result": _results_for(genetic + biochem),
+    }
+
+    formats = {
+        "codec": (codec.encode, codec.decode),
+        "pickle": (lambda r: pickle.dumps(r, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+        "json": (lambda r: json.dumps(r.to_dict()).encode("utf-8"), json.loads),
+    }
+
+    print(f"\n{'tipo':12} {'formato':8} {'bytes/registro':>15} {'ida+vuelta (µs)':>16}")
+    for name, records in feeds.items():
+        for fmt, (dumps, loads) in formats.items():
+            size, cost, decoded = _measure(records, dumps, loads)
+            if fmt == "codec":
+                assert decoded == records, "El codec no reproduce los registros originales"
+            print(f"{name:12} {fmt:8} {size:15.1f} {cost:16.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(run(args.n))
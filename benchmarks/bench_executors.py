@@ -0,0 +1,100 @@
+"""
+Latencia por tipo (p50/p99) con carga mixta: una ráfaga de análisis
+genéticos llega a la vez que el flujo regular de bioquímicos.
+
+Compara el pool único FIFO anterior con los dos modos de ExecutorPools:
+pool común con reparto ponderado ("shared") y un pool por tipo ("isolated").
+Las duraciones se escalan (x0.1) respecto a las de cpu_tasks.
+
+Uso: python benchmarks/bench_executors.py [--workers N] [--burst N] [--steady N]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from processing import cpu_tasks
+from processing.executors import ExecutorPools
+from processing.task_registry import PROCESS, TaskRegistry, TaskSpec
+
+SCALE = 0.1
+
+
+def genetic_task(sample_id: str) -> str:
+    cpu_tasks._simulate_heavy_computation(2.0 * SCALE)
+    return sample_id
+
+
+def biochemical_task(sample_id: str) -> str:
+    cpu_tasks._simulate_heavy_computation(1.5 * SCALE)
+    return sample_id
+
+
+def _registry() -> TaskRegistry:
+    registry = TaskRegistry()
+    registry.register(TaskSpec("genetic", genetic_task, backend=PROCESS))
+    registry.register(TaskSpec("biochemical", biochemical_task, backend=PROCESS))
+    return registry
+
+
+async def _timed(pools: ExecutorPools, spec: TaskSpec, sample_id: str, latencies: list):
+    start_time = time.perf_counter()
+    await pools.run(spec, sample_id)
+    latencies.append((time.perf_counter() - start_time) * 1000)
+
+
+async def _run_mode(mode: str, workers: int, burst: int, steady: int) -> dict:
+
+    registry = _registry()
+    pools = ExecutorPools(registry, max_cpu_workers=workers, max_io_workers=1,
+                          mode="shared" if mode == "fifo" else mode)
+    if mode == "fifo":
+        # Comportamiento anterior: todas las tareas van directas a la cola del pool.
+        pools.scheduler = None
+
+    try:
+        await asyncio.gather(*(pools.prewarm(pool) for pool in pools.pools.values()))
+
+        latencies = {"genetic": [], "biochemical": []}
+        tasks = [
+            asyncio.create_task(_timed(pools, registry.get("genetic"), f"gen_{i}", latencies["genetic"]))
+            for i in range(burst)
+        ]
+        for i in range(steady):
+            tasks.append(asyncio.create_task(
+                _timed(pools, registry.get("biochemical"), f"bio_{i}", latencies["biochemical"])
+            ))
+            await asyncio.sleep(0.5 * SCALE * 4 / workers)
+        await asyncio.gather(*tasks)
+        return latencies
+    finally:
+        pools.shutdown()
+
+
+def _pct(samples: list, q: int) -> float:
+    return statistics.quantiles(samples, n=100)[q - 1]
+
+
+async def run(workers: int, burst: int, steady: int):
+
+    print(f"\n{workers} workers, ráfaga de {burst} genéticos + {steady} bioquímicos regulares")
+    print(f"{'modo':10} {'tipo':12} {'p50 ms':>9} {'p99 ms':>9}")
+    for mode in ("fifo", "shared", "isolated"):
+        latencies = await _run_mode(mode, workers, burst, steady)
+        for data_type, samples in latencies.items():
+            print(f"{mode:10} {data_type:12} {_pct(samples, 50):9.1f} {_pct(samples, 99):9.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--burst", type=int, default=40)
+    parser.add_argument("--steady", type=int, default=40)
+    args = parser.parse_args()
+    asyncio.run(run(args.workers, args.burst, args.steady))
@@ -0,0 +1,124 @@
+"""
+Arranque del sistema con `run.py` en modo headless y con panel web: tiempo
+hasta el primer registro procesado y desglose de importaciones
+(`python -X importtime`) de cada modo y de los workers de CPU.
+
+Uso: python benchmarks/bench_launch.py [--runs N] [--top K]
+"""
+import argparse
+import os
+import re
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Tuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+_FIRST_RECORD = re.compile(r"Primer registro procesado a los ([\d.]+) ms")
+
+# Paquetes pesados que solo deberían cargarse donde se usan.
+HEAVY = ("fastapi", "uvicorn", "starlette", "pydantic", "numpy", "pandas", "matplotlib", "plotly")
+
+
+# Lo que importa el lanzador en cada modo (uvicorn se importa al arrancar el servidor).
+IMPORT_TARGETS: Dict[str, Tuple[str, ...]] = {
+    "headless": ("main",),
+    "completo": ("main", "web", "web.app", "uvicorn"),
+    "worker CPU": ("processing.cpu_tasks",),
+}
+
+
+def import_breakdown(targets: Tuple[str, ...]) -> Tuple[float, List[Tuple[str, float]], Dict[str, float]]:
+
+    # Un único proceso: con -X importtime los hijos de multiprocessing heredan
+    # la opción y mezclarían sus líneas con las del proceso principal.
+    code = "import sys; sys.path[:0] = ['.', 'src']; " + "; ".join(f"import {t}" for t in targets)
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+    # importtime lista cada módulo tras sus dependencias: las de profundidad 1
+    # que preceden a un objetivo son sus importaciones directas.
+    total_ms, children, pending, heavy = 0.0, [], [], {}
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if not match:
+            continue
+        depth, name, cumulative_ms = len(match.group(3)) // 2, match.group(4), int(match.group(2)) / 1000
+        if name in HEAVY and name not in heavy:
+            heavy[name] = cumulative_ms
+        if depth == 1:
+            pending.append((name, cumulative_ms))
+        elif depth == 0:
+            if name in targets:
+                total_ms += cumulative_ms
+                children.extend(pending)
+            pending = []
+    return total_ms, sorted(children, key=lambda item: -item[1]), heavy
+
+
+def time_to_first_record(headless: bool, timeout_sec: float = 60.0) -> Tuple[float, float]:
+
+    # Ctrl+C por defecto en el hijo aunque el lanzador lo herede ignorado.
+    args = [sys.executable, "run.py"] + (["--headless"] if headless else [])
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        args, cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+        env={**os.environ, "PYTHONUNBUFFERED": "1"}, start_new_session=True,
+        preexec_fn=lambda: signal.signal(signal.SIGINT, signal.SIG_DFL)
+    )
+
+    wall_ms = internal_ms = float("nan")
+    try:
+        deadline = start + timeout_sec
+        for line in process.stdout:
+            match = _FIRST_RECORD.search(line)
+            if match:
+                wall_ms = (time.perf_counter() - start) * 1000
+                internal_ms = float(match.group(1))
+                break
+            if time.perf_counter() > deadline:
+                break
+        process.send_signal(signal.SIGINT)
+        process.communicate(timeout=30)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.communicate()
+    return wall_ms, internal_ms
+
+
+def print_breakdown(label: str, targets: Tuple[str, ...], top: int):
+
+    total_ms, children, heavy = import_breakdown(targets)
+    print(f"Importaciones ({label}): {total_ms:.1f} ms")
+    for name, ms in children[:top]:
+        print(f"  {name:<40} {ms:8.1f} ms")
+    loaded = ", ".join(f"{name} {ms:.1f} ms" for name, ms in heavy.items()) or "ninguno"
+    print(f"  paquetes pesados: {loaded}")
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    for headless in (True, False):
+        mode = "headless" if headless else "completo"
+        runs = [time_to_first_record(headless) for _ in range(args.runs)]
+        print(f"\n=== Modo {mode} ===")
+        print(f"Primer registro procesado: mediana {statistics.median(w for w, _ in runs):8.1f} ms desde el "
+              f"lanzamiento ({statistics.median(i for _, i in runs):8.1f} ms desde el arranque de run.py)")
+        print_breakdown(mode, IMPORT_TARGETS[mode], args.top)
+
+    print("\n=== Worker de CPU ===")
+    print_breakdown("processing.cpu_tasks", IMPORT_TARGETS["worker CPU"], args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Carril físico: una llamada de E/S por registro (esquema anterior) frente al
+carril por lotes de `processing.physical_lane`, con la misma carga de
+constantes vitales llegando en ráfagas.
+
+Uso: python benchmarks/bench_physical_batch.py [--n N] [--burst B]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from communication.records import PhysicalRecord
+from monitoring import MetricsCollector
+from processing import io_tasks
+from processing.overload import OverloadController
+from processing.physical_lane import PhysicalLane
+from storage import RecordStore
+from communication.events import data_queue
+
+
+def make_records(n: int):
+    return [PhysicalRecord(f"S{i % 50}", 60 + i % 100, 85 + i % 15) for i in range(n)]
+
+
+async def feed(records, burst: int, handle):
+    for i in range(0, len(records), burst):
+        for record in records[i:i + burst]:
+            await handle(record)
+        await asyncio.sleep(0.001)
+
+
+async def run_per_record(records, burst: int, executor) -> float:
+
+    loop = asyncio.get_running_loop()
+    tasks = []
+
+    async def handle(record):
+        tasks.append(loop.run_in_executor(executor, io_tasks.save_vitals_to_file_sync, record))
+
+    start = time.perf_counter()
+    await feed(records, burst, handle)
+    await asyncio.gather(*tasks)
+    return time.perf_counter() - start
+
+
+async def run_batched(records, burst: int, executor) -> float:
+
+    lane = PhysicalLane(SimpleNamespace(thread_executor=executor), OverloadController())
+    lane.start()
+
+    async def handle(record):
+        lane.submit(record)
+
+    start = time.perf_counter()
+    await feed(records, burst, handle)
+    await lane.close()
+    return time.perf_counter() - start
+
+
+def main():
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=20_000)
+    parser.add_argument("--burst", type=int, default=100)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        executor = ThreadPoolExecutor(max_workers=10)
+        for name, runner in (("por registro", run_per_record), ("por lotes", run_batched)):
+            io_tasks.vitals_store = RecordStore(os.path.join(tmp, f"{runner.__name__}.bin"))
+            elapsed = asyncio.run(runner(make_records(args.n), args.burst, executor))
+            size = os.path.getsize(io_tasks.vitals_store.path)
+            print(f"{name:>13}: {elapsed * 1000:8.1f} ms  "
+                  f"({args.n / elapsed:9.0f} registros/s, {size} B escritos)")
+            while not data_queue.empty():
+                data_queue.get_nowait()
+        executor.shutdown()
+
+    batches = MetricsCollector().get_current_stats()["batches"].get("physical", {})
+    if batches:
+        print(f"lotes: {batches['batches']} (media {batches['average_size']:.1f} registros, "
+              f"E/S media {batches['average_io_ms']:.2f} ms, {batches['io_ms_per_record'] * 1000:.1f} µs/registro)")
+
+
+if __name__ == "__main__":
+    main()
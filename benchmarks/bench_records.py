@@ -0,0 +1,84 @@
+"""
+Memoria por registro en vuelo y coste de pickle: diccionarios de
+`model_dump()` (formato anterior) frente a los registros con __slots__
+de `communication.records`.
+
+Uso: python benchmarks/bench_records.py [--n N]
+"""
+import argparse
+import os
+import pickle
+import sys
+import time
+import uuid
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from communication.records import AnalysisResult, BiochemicalRecord, GeneticRecord, PhysicalRecord
+
+
+def deep_sizeof(obj, seen=None) -> int:
+    seen = seen if seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "__slots__"):
+        size += sum(deep_sizeof(getattr(obj, name), seen) for name in obj.__slots__)
+    return size
+
+
+def build_samples():
+    sample_id = str(uuid.uuid4())
+    sequence = "ATCG" * 8
+    genetic_dict = {
+        "sample_id": sample_id, "sequence": sequence, "detected_mutations": {"T-VIRUS"},
+        "type": "genetic", "metadata": {"source_lab": "Lab-01"}
+    }
+    biochem_dict = {"sample_id": "bio_1234", "toxin_level": 42.5, "protein_x_level": 7.25, "type": "biochemical"}
+    physical_dict = {"subject_id": "subject_3", "heart_rate": 72, "spo2": 97, "type": "physical"}
+    result_dict = {
+        "analysis_id": f"res_{sample_id}", "source_data": genetic_dict,
+        "finding": "Mutación T-Virus detectada", "analysis_type": "genetic"
+    }
+
+    genetic = GeneticRecord(sample_id, sequence, ("T-VIRUS",), "Lab-01")
+    biochem = BiochemicalRecord("bio_1234", 42.5, 7.25)
+    physical = PhysicalRecord("subject_3", 72, 97)
+    result = AnalysisResult(f"res_{sample_id}", "genetic", sample_id, "Mutación T-Virus detectada", "Lab-01")
+
+    return [
+        ("genetic", genetic_dict, genetic),
+        ("biochemical", biochem_dict, biochem),
+        ("physical", physical_dict, physical),
+        ("result", result_dict, result),
+    ]
+
+
+def pickle_cost(obj, n: int):
+    payload = pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL)
+    start_time = time.perf_counter()
+    for _ in range(n):
+        pickle.loads(pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+    return len(payload), (time.perf_counter() - start_time) / n * 1e6
+
+
+def run(n: int):
+    print(f"{'tipo':12} {'repr.':8} {'memoria (B)':>12} {'pickle (B)':>11} {'ida+vuelta (µs)':>16}")
+    for name, as_dict, as_record in build_samples():
+        for label, obj in (("dict", as_dict), ("slots", as_record)):
+            size, cost = pickle_cost(obj, n)
+            print(f"{name:12} {label:8} {deep_sizeof(obj):12} {size:11} {cost:16.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=20000)
+    args = parser.parse_args()
+    run(args.n)
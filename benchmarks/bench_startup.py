@@ -0,0 +1,70 @@
+"""
+Compara la latencia de la primera tarea CPU con el pool por defecto
+(sin precalentar) y con el pool del orquestador (forkserver + precarga
+de `processing.cpu_tasks` + calentamiento de todos los workers).
+
+Uso: python benchmarks/bench_startup.py [--runs N]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from src import config
+from processing import cpu_tasks
+from processing.orchestrator import DataOrchestrator
+
+
+async def _baseline_run(method: str) -> float:
+    loop = asyncio.get_running_loop()
+    executor = ProcessPoolExecutor(
+        max_workers=config.MAX_CPU_WORKERS,
+        mp_context=multiprocessing.get_context(method)
+    )
+    try:
+        start_time = time.perf_counter()
+        await loop.run_in_executor(executor, cpu_tasks.warm_up_worker)
+        return (time.perf_counter() - start_time) * 1000
+    finally:
+        executor.shutdown(wait=True)
+
+
+async def _warm_run() -> dict:
+    orchestrator = DataOrchestrator(asyncio.Queue(), max_cpu_workers=config.MAX_CPU_WORKERS)
+    try:
+        await orchestrator.warm_up()
+        return orchestrator.metrics.get_current_stats()["startup_ms"].copy()
+    finally:
+        orchestrator.pools.shutdown()
+
+
+async def run(runs: int):
+    baselines = {
+        method: [await _baseline_run(method) for _ in range(runs)]
+        for method in ("fork", "spawn")
+        if method in multiprocessing.get_all_start_methods()
+    }
+    warm = [await _warm_run() for _ in range(runs)]
+
+    print()
+    for method, samples in baselines.items():
+        print(f"Pool sin precalentar ({method:5}), primera tarea: mediana {statistics.median(samples):8.2f} ms")
+    print(f"Pool precalentado, arranque en frío:        mediana "
+          f"{statistics.median(w['cpu_pool_cold_start'] for w in warm):8.2f} ms")
+    print(f"Pool precalentado, primera tarea real:      mediana "
+          f"{statistics.median(w['cpu_first_task_warm'] for w in warm):8.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.runs))
@@ -0,0 +1,27 @@
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Genera el informe HTML a partir de los resultados guardados.")
+    parser.add_argument("--output", help="Ruta del informe (por defecto data/report.html)")
+    parser.add_argument("--full", action="store_true", help="Ignora las marcas de agua y recalcula todo")
+    args = parser.parse_args()
+
+    from src import config
+    from analytics import IncrementalAnalytics, write_html_report
+
+    if args.full and os.path.exists(config.ANALYTICS_STATE_PATH):
+        os.remove(config.ANALYTICS_STATE_PATH)
+
+    analytics = IncrementalAnalytics()
+    new_records = analytics.update()
+    analytics.save()
+    path = write_html_report(analytics, args.output)
+
+    print(f"[Report] Nuevos registros: {new_records['results']} resultados, "
+          f"{new_records['vitals']} lecturas de constantes vitales.")
+    print(f"[Report] Informe escrito en {path}")
@@ -1,4 +1,6 @@
+import argparse
 import asyncio
+import time
 import sys
 import os
 import multiprocessing
@@ -11,27 +13,43 @@ if sys.platform == "win32":
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), 'src')))
 
-try:
-    from main import main as run_backend
-    from web import run_web_server
-except ModuleNotFoundError as e:
-    print(f"Error: No se pudo importar el módulo. ¿Estás seguro que 'src' existe?")
-    print(f"Detalle: {e}")
-    sys.exit(1)
 
-async def start_system():
+async def start_system(headless: bool = False):
 
-    print("[Launcher] Iniciando todos los sistemas...")
+    # Importaciones dentro de la función: en plataformas "spawn" los workers
+    # reimportan este módulo como __mp_main__ y no deben cargar todo `src`.
+    # En modo headless ni siquiera se importa la pila web.
+    launch_begin = time.perf_counter()
+    try:
+        from main import main as run_backend
+        if not headless:
+            from web import run_web_server
+    except ModuleNotFoundError as e:
+        print(f"Error: No se pudo importar el módulo. ¿Estás seguro que 'src' existe?")
+        print(f"Detalle: {e}")
+        sys.exit(1)
 
-    backend_task = asyncio.create_task(run_backend())
-    web_server_task = asyncio.create_task(run_web_server())
+    print("[Launcher] Iniciando pipeline sin panel web..." if headless
+          else "[Launcher] Iniciando todos los sistemas...")
+
+    from monitoring import MetricsCollector
+    MetricsCollector().record_startup_time("launcher_imports", (time.perf_counter() - launch_begin) * 1000)
 
+    backend_task = asyncio.create_task(run_backend(startup_begin=launch_begin, headless=headless))
+    if headless:
+        await backend_task
+        return
+
+    web_server_task = asyncio.create_task(run_web_server())
     await asyncio.gather(backend_task, web_server_task)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sistema de Análisis Concurrente de Umbrella")
+    parser.add_argument("--headless", action="store_true", help="solo el pipeline, sin servidor web")
+    args = parser.parse_args()
     try:
-        asyncio.run(start_system())
+        asyncio.run(start_system(headless=args.headless))
     except KeyboardInterrupt:
         print("\n[Launcher] Apagado solicitado por el usuario (Ctrl+C).")
     except Exception as e:
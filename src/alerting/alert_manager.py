@@ -1,10 +1,11 @@
 
 import asyncio
 import time
-from typing import Dict, Any
+from typing import Any
 
+from src.runtime_config import runtime_config
 from monitoring import MetricsCollector
-from web.connection_manager import data_queue
+from communication.events import data_queue
 
 
 class AlertManager:
@@ -13,22 +14,24 @@ class AlertManager:
 
         self.metrics = MetricsCollector()
         self.alert_cooldowns = {}
-        self.cooldown_period_sec = 60
 
-    async def send_alert(self, level: str, message: str, data: Dict[str, Any]):
+    async def send_alert(self, level: str, message: str, data: Any):
+
+        sample_id = getattr(data, "sample_id", None)
+        subject_id = getattr(data, "subject_id", None)
 
         alert_key_parts = [message]
-        if "sample_id" in data:
-            alert_key_parts.append(data["sample_id"])
-        elif "subject_id" in data:
-            alert_key_parts.append(data["subject_id"])
+        if sample_id is not None:
+            alert_key_parts.append(sample_id)
+        elif subject_id is not None:
+            alert_key_parts.append(subject_id)
 
         alert_key = tuple(alert_key_parts)
 
         now = time.monotonic()
         last_alert_time = self.alert_cooldowns.get(alert_key, 0)
 
-        if (now - last_alert_time) < self.cooldown_period_sec:
+        if (now - last_alert_time) < runtime_config.settings.alert_cooldown_sec:
             return
 
         self.alert_cooldowns[alert_key] = now
@@ -36,10 +39,10 @@ class AlertManager:
         start_time = time.perf_counter()
 
         alert_log = f"🚨 ALERTA [{level.upper()}] 🚨: {message}"
-        if "sample_id" in data:
-            alert_log += f" | Sample: {data['sample_id']}"
-        if "subject_id" in data:
-            alert_log += f" | Subject: {data['subject_id']}"
+        if sample_id is not None:
+            alert_log += f" | Sample: {sample_id}"
+        if subject_id is not None:
+            alert_log += f" | Subject: {subject_id}"
 
         print(alert_log)
 
@@ -0,0 +1,10 @@
+# Análisis offline sobre los stores; pandas y las librerías de gráficos
+# solo se cargan al importar este paquete.
+from .aggregates import IncrementalAnalytics, percentile_from_histogram
+from .report import write_html_report
+
+__all__ = [
+    "IncrementalAnalytics",
+    "percentile_from_histogram",
+    "write_html_report"
+]
@@ -0,0 +1,221 @@
+import json
+import os
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from src import config
+from storage import RecordStore
+
+# Histogramas de tamaño fijo: se suman entre pasadas, así que los percentiles
+# se actualizan de forma incremental sin guardar cada latencia.
+LATENCY_EDGES_MS: List[float] = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 1500, 2000, 3000, 5000, 10000, 30000]
+
+TOXIN_EDGES: List[float] = [0, 10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
+
+NO_LAB = "sin laboratorio"
+
+_RESULT_COUNTERS = ("count", "alerts", "latency_sum_ms", "toxin_count", "toxin_sum")
+_VITALS_COUNTERS = ("count", "critical", "hr_count", "hr_sum", "spo2_count", "spo2_sum")
+_INT_COUNTERS = {"count", "alerts", "toxin_count", "critical", "hr_count", "spo2_count"}
+
+
+def _add(entry: Dict[str, Any], row: pd.Series, names: tuple):
+    for name in names:
+        value = row[name]
+        entry[name] += int(value) if name in _INT_COUNTERS else float(value)
+
+
+def _histogram(df: pd.DataFrame, keys: List[str], column: str, edges: List[float]) -> pd.DataFrame:
+
+    # Conteo por (grupo, bucket) en una sola pasada vectorizada.
+    values = df[column].dropna()
+    if values.empty:
+        return pd.DataFrame()
+    buckets = np.searchsorted(np.asarray(edges), values.to_numpy(), side="left")
+    counts = df.loc[values.index, keys].assign(bucket=buckets).groupby(keys + ["bucket"]).size()
+    return counts.unstack("bucket", fill_value=0).reindex(columns=range(len(edges) + 1), fill_value=0)
+
+
+def percentile_from_histogram(hist: List[int], edges: List[float], q: float) -> Optional[float]:
+
+    # Interpolación lineal dentro del bucket (el último se acota a su borde inferior).
+    total = sum(hist)
+    if total == 0:
+        return None
+    target = q * total
+    cumulative = 0
+    for i, count in enumerate(hist):
+        if count and cumulative + count >= target:
+            low = edges[i - 1] if i > 0 else 0.0
+            high = edges[i] if i < len(edges) else edges[-1]
+            return low + (high - low) * (target - cumulative) / count
+        cumulative += count
+    return float(edges[-1])
+
+
+class IncrementalAnalytics:
+
+    def __init__(
+            self,
+            results_store: Optional[RecordStore] = None,
+            vitals_store: Optional[RecordStore] = None,
+            state_path: Optional[str] = None
+    ):
+
+        self.results_store = results_store or RecordStore(config.RESULTS_STORE_PATH)
+        self.vitals_store = vitals_store or RecordStore(config.VITALS_STORE_PATH)
+        self.state_path = state_path or config.ANALYTICS_STATE_PATH
+
+        # Marcas de agua: offset en bytes hasta el que ya se ha agregado cada store.
+        self.watermarks: Dict[str, int] = {"results": 0, "vitals": 0}
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.vitals: Dict[str, Dict[str, Any]] = {}
+        self._load()
+
+    # --- Estado ------------------------------------------------------------------
+
+    def _load(self):
+
+        if not os.path.exists(self.state_path):
+            return
+        with open(self.state_path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        self.watermarks.update(state.get("watermarks", {}))
+        self.results = state.get("results", {})
+        self.vitals = state.get("vitals", {})
+
+    def save(self):
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.state_path)), exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"watermarks": self.watermarks, "results": self.results, "vitals": self.vitals}, f)
+        os.replace(tmp_path, self.state_path)
+
+    # --- Agregación incremental ------------------------------------------------------
+
+    def update(self, chunk_size: int = config.ANALYTICS_CHUNK_SIZE) -> Dict[str, int]:
+
+        # Solo se lee lo escrito tras la última marca de agua.
+        new_records = {"results": 0, "vitals": 0}
+        for records, offset in self.results_store.iter_chunks(chunk_size, self.watermarks["results"]):
+            self._fold_results(records)
+            self.watermarks["results"] = offset
+            new_records["results"] += len(records)
+        for records, offset in self.vitals_store.iter_chunks(chunk_size, self.watermarks["vitals"]):
+            self._fold_vitals(records)
+            self.watermarks["vitals"] = offset
+            new_records["vitals"] += len(records)
+        return new_records
+
+    def _fold_results(self, records: List[Any]):
+
+        df = pd.DataFrame({
+            "analysis_type": [r.analysis_type for r in records],
+            "source_lab": [r.source_lab or NO_LAB for r in records],
+            "finding": [r.finding or "" for r in records],
+            "toxin_level": pd.array([r.toxin_level for r in records], dtype="Float64"),
+            "latency_ms": pd.array([r.latency_ms or None for r in records], dtype="Float64"),
+        })
+        df["alert"] = df["finding"].str.contains("T-Virus", regex=False) | \
+            (df["toxin_level"] > config.TOXIN_THRESHOLD).fillna(False)
+
+        keys = ["analysis_type", "source_lab"]
+        grouped = df.groupby(keys)
+        totals = pd.DataFrame({
+            "count": grouped.size(),
+            "alerts": grouped["alert"].sum(),
+            "latency_sum_ms": grouped["latency_ms"].sum(),
+            "toxin_count": grouped["toxin_level"].count(),
+            "toxin_sum": grouped["toxin_level"].sum(),
+        })
+        latency_hist = _histogram(df, keys, "latency_ms", LATENCY_EDGES_MS)
+        toxin_hist = _histogram(df, keys, "toxin_level", TOXIN_EDGES)
+
+        for (analysis_type, lab), row in totals.iterrows():
+            entry = self.results.setdefault(f"{analysis_type}|{lab}", {
+                "analysis_type": analysis_type, "source_lab": lab,
+                **{name: 0 for name in _RESULT_COUNTERS},
+                "latency_hist": [0] * (len(LATENCY_EDGES_MS) + 1),
+                "toxin_hist": [0] * (len(TOXIN_EDGES) + 1),
+            })
+            _add(entry, row, _RESULT_COUNTERS)
+            for column, hist in (("latency_hist", latency_hist), ("toxin_hist", toxin_hist)):
+                if (analysis_type, lab) in hist.index:
+                    counts = hist.loc[(analysis_type, lab)].to_numpy()
+                    entry[column] = (np.asarray(entry[column]) + counts).astype(int).tolist()
+
+    def _fold_vitals(self, records: List[Any]):
+
+        df = pd.DataFrame({
+            "subject_id": [r.subject_id for r in records],
+            "heart_rate": pd.array([r.heart_rate for r in records], dtype="Float64"),
+            "spo2": pd.array([r.spo2 for r in records], dtype="Float64"),
+        })
+        hr, spo2 = df["heart_rate"], df["spo2"]
+        df["critical"] = ((hr > config.HEART_RATE_MAX) | (hr < config.HEART_RATE_MIN)).fillna(False) | \
+            (spo2 < config.SPO2_MIN).fillna(False)
+
+        grouped = df.groupby("subject_id")
+        totals = pd.DataFrame({
+            "count": grouped.size(),
+            "critical": grouped["critical"].sum(),
+            "hr_count": grouped["heart_rate"].count(),
+            "hr_sum": grouped["heart_rate"].sum(),
+            "hr_min": grouped["heart_rate"].min(),
+            "hr_max": grouped["heart_rate"].max(),
+            "spo2_count": grouped["spo2"].count(),
+            "spo2_sum": grouped["spo2"].sum(),
+            "spo2_min": grouped["spo2"].min(),
+        })
+
+        for subject_id, row in totals.iterrows():
+            entry = self.vitals.setdefault(subject_id, {
+                "subject_id": subject_id, **{name: 0 for name in _VITALS_COUNTERS},
+                "hr_min": None, "hr_max": None, "spo2_min": None,
+            })
+            _add(entry, row, _VITALS_COUNTERS)
+            for name, pick in (("hr_min", min), ("hr_max", max), ("spo2_min", min)):
+                value = row[name]
+                if pd.notna(value):
+                    entry[name] = float(value) if entry[name] is None else pick(entry[name], float(value))
+
+    # --- Resúmenes -------------------------------------------------------------------
+
+    def _results_frame(self, by: List[str]) -> pd.DataFrame:
+
+        if not self.results:
+            return pd.DataFrame()
+        rows = pd.DataFrame(self.results.values())
+        grouped = rows.groupby(by)
+        summary = grouped[list(_RESULT_COUNTERS)].sum()
+        latency_hist = grouped["latency_hist"].agg(lambda hs: np.sum(np.stack(hs.to_list()), axis=0))
+        toxin_hist = grouped["toxin_hist"].agg(lambda hs: np.sum(np.stack(hs.to_list()), axis=0))
+
+        summary["alert_rate"] = summary["alerts"] / summary["count"]
+        summary["latency_mean_ms"] = summary["latency_sum_ms"] / summary["count"]
+        for q in (0.5, 0.95, 0.99):
+            summary[f"latency_p{int(q * 100)}_ms"] = latency_hist.map(
+                lambda h: percentile_from_histogram(list(h), LATENCY_EDGES_MS, q)
+            )
+        summary["toxin_mean"] = (summary["toxin_sum"] / summary["toxin_count"]).where(summary["toxin_count"] > 0)
+        summary["toxin_hist"] = toxin_hist.map(lambda h: [int(n) for n in h])
+        return summary.drop(columns=["latency_sum_ms", "toxin_sum"])
+
+    def by_type(self) -> pd.DataFrame:
+        return self._results_frame(["analysis_type"])
+
+    def by_lab(self) -> pd.DataFrame:
+        return self._results_frame(["analysis_type", "source_lab"])
+
+    def by_subject(self) -> pd.DataFrame:
+
+        if not self.vitals:
+            return pd.DataFrame()
+        summary = pd.DataFrame(self.vitals.values()).set_index("subject_id").sort_index()
+        summary["critical_rate"] = summary["critical"] / summary["count"]
+        summary["hr_mean"] = summary["hr_sum"] / summary["hr_count"].where(summary["hr_count"] > 0)
+        summary["spo2_mean"] = summary["spo2_sum"] / summary["spo2_count"].where(summary["spo2_count"] > 0)
+        return summary[["count", "critical", "critical_rate", "hr_mean", "hr_min", "hr_max", "spo2_mean", "spo2_min"]]
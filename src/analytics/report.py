@@ -0,0 +1,127 @@
+import base64
+import html
+import io
+import os
+import time
+from typing import List, Optional
+
+import pandas as pd
+
+from src import config
+from .aggregates import TOXIN_EDGES, IncrementalAnalytics
+
+_STYLE = """
+body { font-family: sans-serif; background: #1e1e1e; color: #e0e0e0; margin: 2em; }
+h1, h2 { color: #e53935; }
+table { border-collapse: collapse; margin-bottom: 2em; }
+th, td { border: 1px solid #444; padding: 4px 10px; text-align: right; }
+th { background: #2c2c2c; }
+.note { color: #9e9e9e; }
+"""
+
+
+def _toxin_labels() -> List[str]:
+    edges = TOXIN_EDGES
+    return [f"<{edges[0]:g}"] + [f"{edges[i - 1]:g}-{edges[i]:g}" for i in range(1, len(edges))] + [f">{edges[-1]:g}"]
+
+
+def _plotly_charts(by_type: pd.DataFrame, by_subject: pd.DataFrame) -> Optional[List[str]]:
+
+    try:
+        import plotly.graph_objects as go
+    except ImportError:
+        return None
+
+    charts = []
+    if not by_type.empty:
+        figure = go.Figure([
+            go.Bar(name=column, x=by_type.index.tolist(), y=by_type[column].tolist())
+            for column in ("latency_p50_ms", "latency_p95_ms", "latency_p99_ms")
+        ])
+        figure.update_layout(title="Latencia por tipo (ms)", barmode="group", template="plotly_dark")
+        charts.append(figure.to_html(full_html=False, include_plotlyjs="cdn"))
+
+        toxin = by_type["toxin_hist"].get("biochemical")
+        if toxin is not None:
+            figure = go.Figure([go.Bar(x=_toxin_labels(), y=toxin)])
+            figure.update_layout(title="Distribución de toxina (ppm)", template="plotly_dark")
+            charts.append(figure.to_html(full_html=False, include_plotlyjs=False))
+
+    if not by_subject.empty:
+        figure = go.Figure([go.Bar(x=by_subject.index.tolist(), y=by_subject["critical_rate"].tolist())])
+        figure.update_layout(title="Tasa de lecturas críticas por sujeto", template="plotly_dark")
+        charts.append(figure.to_html(full_html=False, include_plotlyjs=False))
+    return charts
+
+
+def _matplotlib_charts(by_type: pd.DataFrame, by_subject: pd.DataFrame) -> Optional[List[str]]:
+
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        return None
+
+    def embed(figure) -> str:
+        buf = io.BytesIO()
+        figure.savefig(buf, format="png", bbox_inches="tight")
+        plt.close(figure)
+        return f'<img src="data:image/png;base64,{base64.b64encode(buf.getvalue()).decode()}">'
+
+    charts = []
+    if not by_type.empty:
+        figure, ax = plt.subplots(figsize=(7, 3.5))
+        by_type[["latency_p50_ms", "latency_p95_ms", "latency_p99_ms"]].plot.bar(ax=ax, title="Latencia por tipo (ms)")
+        charts.append(embed(figure))
+
+        toxin = by_type["toxin_hist"].get("biochemical")
+        if toxin is not None:
+            figure, ax = plt.subplots(figsize=(7, 3.5))
+            ax.bar(_toxin_labels(), toxin)
+            ax.set_title("Distribución de toxina (ppm)")
+            ax.tick_params(axis="x", rotation=45)
+            charts.append(embed(figure))
+
+    if not by_subject.empty:
+        figure, ax = plt.subplots(figsize=(7, 3.5))
+        by_subject["critical_rate"].plot.bar(ax=ax, title="Tasa de lecturas críticas por sujeto")
+        charts.append(embed(figure))
+    return charts
+
+
+def write_html_report(analytics: IncrementalAnalytics, path: Optional[str] = None) -> str:
+
+    path = path or config.ANALYTICS_REPORT_PATH
+    by_type = analytics.by_type()
+    by_lab = analytics.by_lab()
+    by_subject = analytics.by_subject()
+
+    # Gráficos con la librería que esté instalada; sin ninguna, solo tablas.
+    charts = _plotly_charts(by_type, by_subject)
+    if charts is None:
+        charts = _matplotlib_charts(by_type, by_subject)
+    if charts is None:
+        charts = ['<p class="note">Gráficos no disponibles: instala plotly o matplotlib.</p>']
+
+    def table(title: str, df: pd.DataFrame) -> str:
+        if df.empty:
+            return f"<h2>{html.escape(title)}</h2><p class=\"note\">Sin datos.</p>"
+        return f"<h2>{html.escape(title)}</h2>" + df.to_html(float_format=lambda v: f"{v:.2f}", na_rep="-")
+
+    body = "\n".join([
+        "<h1>Informe de análisis de Umbrella</h1>",
+        f'<p class="note">Generado {time.strftime("%Y-%m-%d %H:%M:%S")} · '
+        f'marcas de agua: resultados {analytics.watermarks["results"]} B, '
+        f'constantes vitales {analytics.watermarks["vitals"]} B</p>',
+        *charts,
+        table("Por tipo de análisis", by_type.drop(columns=["toxin_hist"], errors="ignore")),
+        table("Por tipo y laboratorio", by_lab.drop(columns=["toxin_hist"], errors="ignore")),
+        table("Por sujeto", by_subject),
+    ])
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(f"<!DOCTYPE html><html><head><meta charset=\"utf-8\"><title>Informe Umbrella</title>"
+                f"<style>{_STYLE}</style></head><body>{body}</body></html>")
+    return path
@@ -1,16 +1,41 @@
+# Importación perezosa: los workers de CPU solo usan `codec` y `records`, y
+# no deben crear las colas ni cargar asyncio ni la monitorización.
 
-from .queues import (
-    genetic_input_queue,
-    biochemical_input_queue,
-    physical_input_queue,
-    processing_queue
-)
+_QUEUE_TYPES = ("ResizableQueue", "SpillingQueue")
+_QUEUES = ("genetic_input_queue", "biochemical_input_queue", "physical_input_queue", "processing_queue")
+_RECORDS = ("GeneticRecord", "BiochemicalRecord", "PhysicalRecord", "AnalysisResult")
 
 __all__ = [
     # Colas
+    "ResizableQueue",
+    "SpillingQueue",
     "genetic_input_queue",
     "biochemical_input_queue",
     "physical_input_queue",
     "processing_queue",
 
-]
\ No newline at end of file
+    # Registros
+    "GeneticRecord",
+    "BiochemicalRecord",
+    "PhysicalRecord",
+    "AnalysisResult",
+
+    # Eventos del panel
+    "data_queue",
+]
+
+
+def __getattr__(name):
+    if name in _QUEUE_TYPES:
+        from . import queue_types
+        return getattr(queue_types, name)
+    if name in _QUEUES:
+        from . import queues
+        return getattr(queues, name)
+    if name in _RECORDS:
+        from . import records
+        return getattr(records, name)
+    if name == "data_queue":
+        from .events import data_queue
+        return data_queue
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,311 @@
+import math
+import struct
+import sys
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .records import AnalysisResult, BiochemicalRecord, GeneticRecord, PhysicalRecord
+
+# Formato binario versionado de los registros del pipeline.
+#
+#   cabecera: [versión u8][tipo u8]
+#   cadenas:  varint n -> 0 = None, 1 = literal (varint len + UTF-8), n >= 2 = VOCABULARY[n - 2]
+#   números:  anchura fija little-endian (f64 / i16 con centinela para None)
+#   secuencia genética: [modo u8][nº bases varint][bases empaquetadas a 2 bits]
+#   v2: los registros de entrada añaden [ingested_at f64][deadline f64] al final.
+#
+# Cualquier cambio en el formato o en VOCABULARY exige subir CODEC_VERSION;
+# decode() sigue leyendo las versiones anteriores.
+
+CODEC_VERSION = 2
+
+_SUPPORTED_VERSIONS = (1, 2)
+
+VOCABULARY: Tuple[str, ...] = (
+    "genetic",
+    "biochemical",
+    "physical",
+    "T-VIRUS",
+    "G-VIRUS",
+    "Lab-01",
+    "Estable",
+    "Mutación T-Virus detectada",
+    "Niveles de toxina inestables",
+)
+
+_VOCABULARY_INDEX = {word: i for i, word in enumerate(VOCABULARY)}
+
+_TAG_GENETIC = 1
+_TAG_BIOCHEMICAL = 2
+_TAG_PHYSICAL = 3
+_TAG_RESULT = 4
+
+_SEQ_PACKED = 0
+_SEQ_LITERAL = 1
+
+_BITS_TO_BASE = "ACGT"
+_BASE_TO_DIGIT = str.maketrans("ACGT", "0123")
+_STRIP_BASES = str.maketrans("", "", "ACGT")
+
+# Tabla de decodificación de un byte completo (4 bases).
+_BYTE_TO_BASES = tuple(
+    "".join(_BITS_TO_BASE[(byte >> shift) & 0b11] for shift in (6, 4, 2, 0))
+    for byte in range(256)
+)
+
+_F64 = struct.Struct("<d")
+_I16 = struct.Struct("<h")
+_I16_NONE = -32768
+_TIMING = struct.Struct("<dd")
+
+
+class CodecError(ValueError):
+    pass
+
+
+# --- Primitivas ---------------------------------------------------------------
+
+def _write_varint(buf: bytearray, value: int):
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _write_str(buf: bytearray, value: Optional[str]):
+    if value is None:
+        buf.append(0)
+        return
+    index = _VOCABULARY_INDEX.get(value)
+    if index is not None:
+        _write_varint(buf, index + 2)
+        return
+    raw = value.encode("utf-8")
+    buf.append(1)
+    _write_varint(buf, len(raw))
+    buf += raw
+
+
+def _read_str(data: bytes, pos: int, intern: bool = False) -> Tuple[Optional[str], int]:
+    code, pos = _read_varint(data, pos)
+    if code == 0:
+        return None, pos
+    if code >= 2:
+        return VOCABULARY[code - 2], pos
+    length, pos = _read_varint(data, pos)
+    value = data[pos:pos + length].decode("utf-8")
+    # Laboratorios y sujetos se repiten en casi todos los registros.
+    return (sys.intern(value) if intern else value), pos + length
+
+
+def _write_f64(buf: bytearray, value: Optional[float]):
+    buf += _F64.pack(math.nan if value is None else value)
+
+
+def _read_f64(data: bytes, pos: int) -> Tuple[Optional[float], int]:
+    (value,) = _F64.unpack_from(data, pos)
+    return (None if math.isnan(value) else value), pos + 8
+
+
+def _write_i16(buf: bytearray, value: Optional[int]):
+    buf += _I16.pack(_I16_NONE if value is None else value)
+
+
+def _read_i16(data: bytes, pos: int) -> Tuple[Optional[int], int]:
+    (value,) = _I16.unpack_from(data, pos)
+    return (None if value == _I16_NONE else value), pos + 2
+
+
+def pack_sequence(sequence: str) -> bytes:
+
+    if sequence.translate(_STRIP_BASES):
+        raise CodecError("La secuencia contiene bases fuera de ACGT")
+
+    # Cada base es un dígito en base 4; int() hace el empaquetado en C.
+    n_bytes = (len(sequence) + 3) // 4
+    if n_bytes == 0:
+        return b""
+    digits = sequence.translate(_BASE_TO_DIGIT).ljust(n_bytes * 4, "0")
+    return int(digits, 4).to_bytes(n_bytes, "big")
+
+
+def unpack_sequence(packed: bytes, length: int) -> str:
+    return "".join(map(_BYTE_TO_BASES.__getitem__, packed))[:length]
+
+
+def _write_sequence(buf: bytearray, sequence: str):
+    try:
+        packed = pack_sequence(sequence)
+    except CodecError:
+        buf.append(_SEQ_LITERAL)
+        _write_str(buf, sequence)
+        return
+    buf.append(_SEQ_PACKED)
+    _write_varint(buf, len(sequence))
+    buf += packed
+
+
+def _read_sequence(data: bytes, pos: int) -> Tuple[str, int]:
+    mode = data[pos]
+    pos += 1
+    if mode == _SEQ_LITERAL:
+        return _read_str(data, pos)
+    length, pos = _read_varint(data, pos)
+    end = pos + (length + 3) // 4
+    return unpack_sequence(data[pos:end], length), end
+
+
+def _write_timing(buf: bytearray, record: Any):
+    buf += _TIMING.pack(record.ingested_at, record.deadline)
+
+
+def _read_timing(data: bytes, pos: int, version: int) -> Tuple[float, float, int]:
+    if version < 2:
+        return 0.0, 0.0, pos
+    ingested_at, deadline = _TIMING.unpack_from(data, pos)
+    return ingested_at, deadline, pos + _TIMING.size
+
+
+# --- Registros ------------------------------------------------------------------
+
+def _encode_genetic(buf: bytearray, record: GeneticRecord):
+    _write_str(buf, record.sample_id)
+    _write_sequence(buf, record.sequence)
+    _write_varint(buf, len(record.detected_mutations))
+    for mutation in record.detected_mutations:
+        _write_str(buf, mutation)
+    _write_str(buf, record.source_lab)
+    _write_timing(buf, record)
+
+
+def _decode_genetic(data: bytes, pos: int, version: int) -> Tuple[GeneticRecord, int]:
+    sample_id, pos = _read_str(data, pos)
+    sequence, pos = _read_sequence(data, pos)
+    count, pos = _read_varint(data, pos)
+    mutations = []
+    for _ in range(count):
+        mutation, pos = _read_str(data, pos, intern=True)
+        mutations.append(mutation)
+    source_lab, pos = _read_str(data, pos, intern=True)
+    ingested_at, deadline, pos = _read_timing(data, pos, version)
+    return GeneticRecord(sample_id, sequence, tuple(mutations), source_lab, ingested_at, deadline), pos
+
+
+def _encode_biochemical(buf: bytearray, record: BiochemicalRecord):
+    _write_str(buf, record.sample_id)
+    _write_f64(buf, record.toxin_level)
+    _write_f64(buf, record.protein_x_level)
+    _write_timing(buf, record)
+
+
+def _decode_biochemical(data: bytes, pos: int, version: int) -> Tuple[BiochemicalRecord, int]:
+    sample_id, pos = _read_str(data, pos)
+    toxin_level, pos = _read_f64(data, pos)
+    protein_x_level, pos = _read_f64(data, pos)
+    ingested_at, deadline, pos = _read_timing(data, pos, version)
+    return BiochemicalRecord(sample_id, toxin_level, protein_x_level, ingested_at, deadline), pos
+
+
+def _encode_physical(buf: bytearray, record: PhysicalRecord):
+    _write_str(buf, record.subject_id)
+    _write_i16(buf, record.heart_rate)
+    _write_i16(buf, record.spo2)
+    _write_timing(buf, record)
+
+
+def _decode_physical(data: bytes, pos: int, version: int) -> Tuple[PhysicalRecord, int]:
+    subject_id, pos = _read_str(data, pos, intern=True)
+    heart_rate, pos = _read_i16(data, pos)
+    spo2, pos = _read_i16(data, pos)
+    ingested_at, deadline, pos = _read_timing(data, pos, version)
+    return PhysicalRecord(subject_id, heart_rate, spo2, ingested_at, deadline), pos
+
+
+def _encode_result(buf: bytearray, record: AnalysisResult):
+    _write_str(buf, record.analysis_id)
+    _write_str(buf, record.analysis_type)
+    _write_str(buf, record.sample_id)
+    _write_str(buf, record.finding)
+    _write_str(buf, record.source_lab)
+    _write_f64(buf, record.toxin_level)
+    _write_f64(buf, record.latency_ms)
+
+
+def _decode_result(data: bytes, pos: int, version: int) -> Tuple[AnalysisResult, int]:
+    analysis_id, pos = _read_str(data, pos)
+    analysis_type, pos = _read_str(data, pos, intern=True)
+    sample_id, pos = _read_str(data, pos)
+    finding, pos = _read_str(data, pos, intern=True)
+    source_lab, pos = _read_str(data, pos, intern=True)
+    toxin_level, pos = _read_f64(data, pos)
+    latency_ms, pos = _read_f64(data, pos)
+    return AnalysisResult(
+        analysis_id, analysis_type, sample_id, finding, source_lab, toxin_level, latency_ms or 0.0
+    ), pos
+
+
+_ENCODERS: Dict[type, Tuple[int, Callable[[bytearray, Any], None]]] = {
+    GeneticRecord: (_TAG_GENETIC, _encode_genetic),
+    BiochemicalRecord: (_TAG_BIOCHEMICAL, _encode_biochemical),
+    PhysicalRecord: (_TAG_PHYSICAL, _encode_physical),
+    AnalysisResult: (_TAG_RESULT, _encode_result),
+}
+
+_DECODERS: Dict[int, Callable[[bytes, int, int], Tuple[Any, int]]] = {
+    _TAG_GENETIC: _decode_genetic,
+    _TAG_BIOCHEMICAL: _decode_biochemical,
+    _TAG_PHYSICAL: _decode_physical,
+    _TAG_RESULT: _decode_result,
+}
+
+
+def is_encodable(record: Any) -> bool:
+    return type(record) in _ENCODERS
+
+
+def encode(record: Any) -> bytes:
+
+    try:
+        tag, encoder = _ENCODERS[type(record)]
+    except KeyError:
+        raise CodecError(f"Tipo de registro no soportado: {type(record).__name__}")
+
+    buf = bytearray((CODEC_VERSION, tag))
+    encoder(buf, record)
+    return bytes(buf)
+
+
+def decode(payload: bytes) -> Any:
+
+    if len(payload) < 2:
+        raise CodecError("Payload truncado")
+
+    version, tag = payload[0], payload[1]
+    if version not in _SUPPORTED_VERSIONS:
+        raise CodecError(f"Versión de codec no soportada: {version}")
+
+    try:
+        decoder = _DECODERS[tag]
+    except KeyError:
+        raise CodecError(f"Tipo de registro desconocido: {tag}")
+
+    try:
+        record, pos = decoder(payload, 2, version)
+    except (IndexError, struct.error, UnicodeDecodeError) as e:
+        raise CodecError(f"Payload corrupto: {e}")
+
+    if pos != len(payload):
+        raise CodecError("Bytes sobrantes tras el registro")
+    return record
+
@@ -0,0 +1,13 @@
+import asyncio
+
+# Eventos para el panel (alertas, latencias, constantes vitales). Vive fuera de
+# `web` para que el pipeline pueda publicar sin importar FastAPI.
+data_queue: asyncio.Queue = asyncio.Queue()
+
+
+async def discard_events(queue: asyncio.Queue = data_queue):
+
+    # Sin panel nadie consume los eventos: se vacían para que la cola no crezca.
+    while True:
+        await queue.get()
+        queue.task_done()
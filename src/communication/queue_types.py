@@ -0,0 +1,162 @@
+import asyncio
+import os
+import pickle
+import struct
+import time
+from typing import Any, Optional
+
+from src import config
+from monitoring import MetricsCollector
+from . import codec
+
+# Segmento de desbordamiento: [formato u8][len u32][spilled_at f64][payload]
+_FRAME = struct.Struct("<BId")
+
+_FORMAT_CODEC = 0
+_FORMAT_PICKLE = 1
+
+
+def _encode_item(item: Any) -> bytes:
+
+    # El codec no transporta la traza ni la marca de crítico: esos registros
+    # (y los dicts crudos de las colas de entrada) van por pickle.
+    if codec.is_encodable(item) and getattr(item, "trace", None) is None \
+            and not getattr(item, "critical", False):
+        return bytes((_FORMAT_CODEC,)) + codec.encode(item)
+    return bytes((_FORMAT_PICKLE,)) + pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _decode_item(fmt: int, payload: bytes) -> Any:
+    if fmt == _FORMAT_CODEC:
+        return codec.decode(payload)
+    return pickle.loads(payload)
+
+
+class ResizableQueue(asyncio.Queue):
+
+    def resize(self, maxsize: int):
+
+        # Nunca descarta elementos: si la cola ya supera el nuevo límite,
+        # los productores esperan hasta que baje de él.
+        self._maxsize = maxsize
+        free = (maxsize - self.qsize()) if maxsize > 0 else len(self._putters)
+        for _ in range(max(free, 0)):
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+
+
+class SpillingQueue(ResizableQueue):
+
+    # maxsize es el límite en memoria; lo que lo supera va a un segmento en
+    # disco y se relee en orden cuando el consumidor lo alcanza. Los
+    # productores solo esperan si el segmento llega a max_spill_bytes.
+
+    def __init__(
+            self,
+            maxsize: int = 0,
+            name: str = "queue",
+            spill_dir: Optional[str] = None,
+            max_spill_bytes: Optional[int] = None
+    ):
+
+        self.name = name
+        self.spill_path = os.path.join(spill_dir or config.SPILL_DIR, f"{name}.spill")
+        self.max_spill_bytes = config.SPILL_MAX_BYTES if max_spill_bytes is None else max_spill_bytes
+        self.metrics = MetricsCollector()
+
+        self._writer = None
+        self._reader = None
+        self._spilled_items = 0
+        self._write_offset = 0
+        self._read_offset = 0
+        super().__init__(maxsize=maxsize)
+
+    # --- Interfaz de asyncio.Queue ------------------------------------------
+
+    def qsize(self) -> int:
+        return len(self._queue) + self._spilled_items
+
+    def empty(self) -> bool:
+        return not self._queue and not self._spilled_items
+
+    def full(self) -> bool:
+        return self.max_spill_bytes > 0 and self.spilled_bytes >= self.max_spill_bytes
+
+    def _put(self, item: Any):
+
+        # Mientras quede algo en disco todo va detrás de ello, o se perdería el orden.
+        if self._spilled_items or (self._maxsize > 0 and len(self._queue) >= self._maxsize):
+            self._spill(item)
+        else:
+            self._queue.append(item)
+
+    def _get(self) -> Any:
+
+        if not self._queue:
+            self._recover()
+        item = self._queue.popleft()
+        if self._spilled_items and len(self._queue) < self._maxsize // 2:
+            self._recover()
+        return item
+
+    def resize(self, maxsize: int):
+
+        self._maxsize = maxsize
+        if self._spilled_items:
+            self._recover()
+        while self._putters and not self.full():
+            self._wakeup_next(self._putters)
+
+    # --- Segmento en disco --------------------------------------------------
+
+    @property
+    def spilled_bytes(self) -> int:
+        return self._write_offset - self._read_offset
+
+    def _spill(self, item: Any):
+
+        if self._writer is None:
+            os.makedirs(os.path.dirname(self.spill_path), exist_ok=True)
+            # Lo que quedara de una ejecución anterior ya no tiene consumidor.
+            self._writer = open(self.spill_path, "wb")
+            self._reader = open(self.spill_path, "rb")
+
+        data = _encode_item(item)
+        frame = _FRAME.pack(data[0], len(data) - 1, time.monotonic()) + data[1:]
+        self._writer.write(frame)
+        self._write_offset += len(frame)
+        self._spilled_items += 1
+        self.metrics.record_queue_spill(self.name, len(frame), self.spilled_bytes)
+
+    def _recover(self):
+
+        # Lectura secuencial con buffer hasta rellenar la parte en memoria.
+        self._writer.flush()
+        room = max(self._maxsize - len(self._queue), 1)
+        now = time.monotonic()
+        recovered = 0
+        max_lag = 0.0
+        while self._spilled_items and recovered < room:
+            fmt, length, spilled_at = _FRAME.unpack(self._reader.read(_FRAME.size))
+            self._queue.append(_decode_item(fmt, self._reader.read(length)))
+            self._read_offset += _FRAME.size + length
+            self._spilled_items -= 1
+            recovered += 1
+            max_lag = max(max_lag, now - spilled_at)
+
+        if not self._spilled_items:
+            # Segmento vacío: se trunca para no crecer indefinidamente.
+            self._writer.seek(0)
+            self._writer.truncate()
+            self._reader.seek(0)
+            self._write_offset = self._read_offset = 0
+
+        self.metrics.record_queue_recovery(self.name, recovered, max_lag * 1000, self.spilled_bytes)
+
+    def close(self):
+
+        for handle in (self._writer, self._reader):
+            if handle is not None:
+                handle.close()
+        self._writer = self._reader = None
@@ -1,14 +1,14 @@
+from src import config
+from .queue_types import SpillingQueue
 
-import asyncio
 
 
+genetic_input_queue = SpillingQueue(maxsize=config.INPUT_QUEUE_MAXSIZE, name="genetic_input")
 
-genetic_input_queue = asyncio.Queue(maxsize=100)
+biochemical_input_queue = SpillingQueue(maxsize=config.INPUT_QUEUE_MAXSIZE, name="biochemical_input")
 
-biochemical_input_queue = asyncio.Queue(maxsize=100)
+physical_input_queue = SpillingQueue(maxsize=config.INPUT_QUEUE_MAXSIZE, name="physical_input")
 
-physical_input_queue = asyncio.Queue(maxsize=100)
 
 
-
-processing_queue = asyncio.Queue(maxsize=300)
+processing_queue = SpillingQueue(maxsize=config.PROCESSING_QUEUE_MAXSIZE, name="processing")
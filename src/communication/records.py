@@ -0,0 +1,83 @@
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Any, ClassVar, Dict, Optional, Tuple
+
+
+_FIELD_GETTERS: Dict[type, Any] = {}
+
+
+class _Record:
+
+    __slots__ = ()
+
+    type: ClassVar[str] = "unknown"
+
+    def __reduce__(self):
+        # Pickle compacto: clase + tupla posicional, sin nombres de campo.
+        cls = self.__class__
+        getter = _FIELD_GETTERS.get(cls)
+        if getter is None:
+            getter = _FIELD_GETTERS[cls] = attrgetter(*cls.__slots__)
+        return (cls, getter(self))
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {name: getattr(self, name) for name in self.__slots__ if name != "trace"}
+        data["type"] = self.type
+        return data
+
+
+@dataclass(slots=True)
+class GeneticRecord(_Record):
+
+    type: ClassVar[str] = "genetic"
+
+    sample_id: str
+    sequence: str
+    detected_mutations: Tuple[str, ...] = ()
+    source_lab: Optional[str] = None
+    ingested_at: float = 0.0
+    deadline: float = 0.0
+    critical: bool = field(default=False, compare=False)
+    trace: Any = field(default=None, compare=False, repr=False)
+
+
+@dataclass(slots=True)
+class BiochemicalRecord(_Record):
+
+    type: ClassVar[str] = "biochemical"
+
+    sample_id: str
+    toxin_level: float
+    protein_x_level: float
+    ingested_at: float = 0.0
+    deadline: float = 0.0
+    critical: bool = field(default=False, compare=False)
+    trace: Any = field(default=None, compare=False, repr=False)
+
+
+@dataclass(slots=True)
+class PhysicalRecord(_Record):
+
+    type: ClassVar[str] = "physical"
+
+    subject_id: str
+    heart_rate: Optional[int] = None
+    spo2: Optional[int] = None
+    ingested_at: float = 0.0
+    deadline: float = 0.0
+    critical: bool = field(default=False, compare=False)
+    trace: Any = field(default=None, compare=False, repr=False)
+
+
+@dataclass(slots=True)
+class AnalysisResult(_Record):
+
+    type: ClassVar[str] = "result"
+
+    analysis_id: str
+    analysis_type: str
+    sample_id: str
+    finding: str
+    source_lab: Optional[str] = None
+    toxin_level: Optional[float] = None
+    latency_ms: float = 0.0
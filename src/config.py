@@ -1,6 +1,121 @@
+import os
+from typing import Dict, Tuple
 
 MAX_CPU_WORKERS: int = 4
 
 MAX_IO_WORKERS: int = 10
 
-SIMULATION_SPEED: float = 1.0
\ No newline at end of file
+INPUT_QUEUE_MAXSIZE: int = 100
+
+PROCESSING_QUEUE_MAXSIZE: int = 300
+
+SIMULATION_SPEED: float = 1.0
+
+# "forkserver" evita heredar el estado del proceso padre; en plataformas sin
+# soporte (Windows) el orquestador recurre a "spawn".
+CPU_START_METHOD: str = "forkserver"
+
+# Solo las dependencias de las tareas CPU: nada de FastAPI ni Pydantic.
+CPU_PRELOAD_MODULES: Tuple[str, ...] = ("processing.cpu_tasks",)
+
+# Ventanas deslizantes de constantes vitales por sujeto (nº de muestras).
+VITALS_WINDOWS: Dict[str, int] = {"short": 10, "long": 60}
+
+# Alerta de tendencia: caída sostenida de SpO2 (puntos por segundo).
+SPO2_TREND_WINDOW: str = "short"
+
+SPO2_DECLINE_SLOPE: float = -0.02
+
+SPO2_TREND_MIN_SAMPLES: int = 5
+
+# Almacenamiento append-only de resultados (codec binario).
+DATA_DIR: str = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+RESULTS_STORE_PATH: str = os.path.join(DATA_DIR, "analysis_results.bin")
+
+VITALS_STORE_PATH: str = os.path.join(DATA_DIR, "vitals.bin")
+
+# Desbordamiento a disco de las colas (por encima del límite en memoria).
+SPILL_DIR: str = os.path.join(DATA_DIR, "spill")
+
+# Con el segmento lleno los productores vuelven a esperar (0 = sin límite).
+SPILL_MAX_BYTES: int = 256 * 1024 * 1024
+
+# Trazado por registro: fracción muestreada y nº de trazas retenidas para exportar.
+TRACE_SAMPLE_RATE: float = 0.1
+
+TRACE_BUFFER_SIZE: int = 2000
+
+# Muestreo de profundidad de colas y retardo del event loop.
+LOOP_MONITOR_INTERVAL_SEC: float = 0.1
+
+LOOP_BLOCK_THRESHOLD_MS: float = 100.0
+
+# Control de sobrecarga: SLO de latencia por tipo (ms) y reacción al superarlo.
+SLO_LATENCY_MS: Dict[str, float] = {"genetic": 5000.0, "biochemical": 4000.0, "physical": 1000.0}
+
+OVERLOAD_EWMA_ALPHA: float = 0.2
+
+# Fracción de registros rutinarios que se siguen procesando en modo degradado.
+DEGRADED_SAMPLE_RATES: Dict[str, float] = {"biochemical": 0.5, "physical": 0.25}
+
+VITALS_COALESCE_SEC: float = 5.0
+
+# Carril físico por lotes: ventana de acumulación y tamaño máximo de lote.
+PHYSICAL_BATCH_WINDOW_SEC: float = 0.02
+
+PHYSICAL_BATCH_SIZE: int = 256
+
+# Plazo máximo desde la ingesta: pasado el deadline el resultado ya no sirve.
+DEADLINE_SEC: Dict[str, float] = {"genetic": 10.0, "biochemical": 8.0, "physical": 5.0}
+
+# Deduplicación probabilística a la entrada (filtros de Bloom rotativos).
+DEDUP_WINDOW_SEC: float = 300.0
+
+# Registros por generación del filtro y tasa de falsos positivos objetivo.
+DEDUP_CAPACITY: int = 50000
+
+DEDUP_FP_RATE: float = 0.001
+
+# Confirma cada acierto del filtro contra un índice exacto de la ventana.
+DEDUP_EXACT_CONFIRM: bool = False
+
+# Fracción de registros que los simuladores reentregan (duplicados del origen).
+INGESTION_REDELIVERY_RATE: float = 0.02
+
+# Umbrales de eventos críticos y enfriamiento de alertas repetidas.
+ALERT_COOLDOWN_SEC: float = 60.0
+
+TOXIN_THRESHOLD: float = 80.0
+
+PROTEIN_X_MIN: float = 5.0
+
+HEART_RATE_MAX: float = 190.0
+
+HEART_RATE_MIN: float = 40.0
+
+SPO2_MIN: float = 90.0
+
+# Configuración en caliente: cambios retenidos y ventana para medir su efecto.
+RUNTIME_HISTORY_SIZE: int = 50
+
+RUNTIME_EFFECT_WINDOW_SEC: float = 30.0
+
+# Backend por tipo de análisis: "process", "thread" (código que libera el GIL) o "inline".
+TASK_BACKENDS: Dict[str, str] = {"genetic": "process", "biochemical": "process"}
+
+# "shared": un pool común con reparto ponderado justo entre tipos;
+# "isolated": un pool por tipo, repartiendo MAX_CPU_WORKERS según el peso.
+CPU_POOL_MODE: str = "shared"
+
+CPU_POOL_WEIGHTS: Dict[str, float] = {"genetic": 1.0, "biochemical": 1.0}
+
+# Afinidad de CPU por pool ("shared" o el tipo de dato), p. ej. {"genetic": (0, 1)}.
+CPU_AFFINITY: Dict[str, Tuple[int, ...]] = {}
+
+# Análisis offline: estado incremental (marcas de agua) e informe HTML.
+ANALYTICS_STATE_PATH: str = os.path.join(DATA_DIR, "analytics_state.json")
+
+ANALYTICS_REPORT_PATH: str = os.path.join(DATA_DIR, "report.html")
+
+ANALYTICS_CHUNK_SIZE: int = 10_000
@@ -1,5 +1,6 @@
 
 
+from .dedup import BloomFilter, RotatingBloomFilter, DeduplicationStage
 from .data_fetchers import (
     simulate_genetic_data_feed,
     simulate_biochemical_data_feed,
@@ -7,6 +8,9 @@ from .data_fetchers import (
 )
 
 __all__ = [
+    "BloomFilter",
+    "RotatingBloomFilter",
+    "DeduplicationStage",
     "simulate_genetic_data_feed",
     "simulate_biochemical_data_feed",
     "simulate_physical_data_feed"
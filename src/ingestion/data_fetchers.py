@@ -1,9 +1,30 @@
 
 import asyncio
 import random
+import time
 import uuid
 from asyncio import Queue
 
+from src import config
+from monitoring import tracer
+
+
+def _attach_trace(data: dict, record_type: str, key: str):
+
+    trace = tracer.start(record_type, key)
+    if trace is not None:
+        data["_trace"] = trace
+
+
+async def _maybe_redeliver(queue: Queue, data: dict):
+
+    # Simula un origen con entrega "al menos una vez": a veces reenvía el
+    # mismo registro, que llega más tarde con un sello de ingesta nuevo.
+    if random.random() < config.INGESTION_REDELIVERY_RATE:
+        duplicate = {k: v for k, v in data.items() if k != "_trace"}
+        duplicate["ingested_at"] = time.time()
+        await queue.put(duplicate)
+
 
 async def simulate_genetic_data_feed(queue: Queue, simulation_speed: float = 1.0):
 
@@ -22,10 +43,13 @@ async def simulate_genetic_data_feed(queue: Queue, simulation_speed: float = 1.0
         data = {
             "sample_id": str(uuid.uuid4()),
             "raw_sequence": raw_sequence,
-            "metadata": {"source_lab": "Lab-01"}
+            "metadata": {"source_lab": "Lab-01"},
+            "ingested_at": time.time()
         }
+        _attach_trace(data, "genetic", data["sample_id"])
 
         await queue.put(data)
+        await _maybe_redeliver(queue, data)
 
 
 async def simulate_biochemical_data_feed(queue: Queue, simulation_speed: float = 1.0):
@@ -42,10 +66,13 @@ async def simulate_biochemical_data_feed(queue: Queue, simulation_speed: float =
         data = {
             "sample_id": f"bio_{random.randint(1000, 9999)}",
             "toxin_level": toxin,
-            "protein_x": random.uniform(1.0, 15.0)
+            "protein_x": random.uniform(1.0, 15.0),
+            "ingested_at": time.time()
         }
+        _attach_trace(data, "biochemical", data["sample_id"])
 
         await queue.put(data)
+        await _maybe_redeliver(queue, data)
 
 
 async def simulate_physical_data_feed(queue: Queue, simulation_speed: float = 1.0):
@@ -70,7 +97,9 @@ async def simulate_physical_data_feed(queue: Queue, simulation_speed: float = 1.
             "vitals": {
                 "heart_rate": heart_rate,
                 "spo2": spo2
-            }
+            },
+            "ingested_at": time.time()
         }
+        _attach_trace(data, "physical", data["subject_id"])
 
         await queue.put(data)
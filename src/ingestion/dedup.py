@@ -0,0 +1,137 @@
+import hashlib
+import json
+import math
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from src import config
+from monitoring import MetricsCollector
+
+
+class BloomFilter:
+
+    def __init__(self, capacity: int, fp_rate: float):
+
+        # Tamaño óptimo: m = -n·ln(p) / ln(2)², k = (m / n)·ln(2)
+        self.size_bits = max(8, int(math.ceil(-capacity * math.log(fp_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.size_bits / capacity * math.log(2))))
+        self.bits = bytearray((self.size_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        # Doble hashing (Kirsch-Mitzenmacher) sobre un único digest.
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.size_bits
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self.bits)
+
+
+class RotatingBloomFilter:
+
+    def __init__(self, window_sec: float, capacity: int, fp_rate: float, generations: int = 2):
+
+        # Cada generación cubre window/generations segundos; al rotar se
+        # descarta la más antigua, de modo que la memoria queda acotada.
+        self.generation_sec = window_sec / generations
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self.filters: deque = deque(
+            [BloomFilter(capacity, fp_rate) for _ in range(generations)], maxlen=generations
+        )
+        self._rotated_at = time.monotonic()
+
+    def _maybe_rotate(self, now: float):
+        # También se rota si la generación actual se llena: por encima de su
+        # capacidad la tasa de falsos positivos dejaría de cumplirse.
+        if now - self._rotated_at >= self.generation_sec or self.filters[-1].count >= self.capacity:
+            self.filters.append(BloomFilter(self.capacity, self.fp_rate))
+            self._rotated_at = now
+
+    def check_and_add(self, key: str, now: Optional[float] = None) -> bool:
+
+        self._maybe_rotate(time.monotonic() if now is None else now)
+        seen = any(key in bloom for bloom in self.filters)
+        if not seen:
+            self.filters[-1].add(key)
+        return seen
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(bloom.memory_bytes for bloom in self.filters)
+
+
+class DeduplicationStage:
+
+    # Campos que pone nuestra propia ingesta: una reentrega los trae distintos.
+    IGNORED_FIELDS = ("ingested_at", "_trace")
+
+    def __init__(
+            self,
+            window_sec: Optional[float] = None,
+            capacity: Optional[int] = None,
+            fp_rate: Optional[float] = None,
+            exact_confirm: Optional[bool] = None
+    ):
+
+        self.window_sec = window_sec or config.DEDUP_WINDOW_SEC
+        self.filter = RotatingBloomFilter(
+            self.window_sec,
+            capacity or config.DEDUP_CAPACITY,
+            fp_rate or config.DEDUP_FP_RATE
+        )
+        self.exact_confirm = config.DEDUP_EXACT_CONFIRM if exact_confirm is None else exact_confirm
+        self._exact: Dict[str, float] = {}
+        self._exact_order: deque = deque()
+        self.metrics = MetricsCollector()
+
+    def _key(self, record_type: str, raw_data: Dict[str, Any]) -> str:
+        # Huella del contenido: sample_id solo no basta porque los simuladores
+        # reutilizan identificadores cortos (p. ej. bio_1000..9999).
+        payload = {k: v for k, v in raw_data.items() if k not in self.IGNORED_FIELDS}
+        return f"{record_type}:{json.dumps(payload, sort_keys=True, default=str)}"
+
+    def _confirm(self, key: str, now: float) -> bool:
+
+        while self._exact_order and now - self._exact_order[0][0] > self.window_sec:
+            _, old_key = self._exact_order.popleft()
+            if self._exact.get(old_key, 0) <= now - self.window_sec:
+                self._exact.pop(old_key, None)
+
+        seen = key in self._exact
+        self._exact[key] = now
+        self._exact_order.append((now, key))
+        return seen
+
+    def is_duplicate(self, record_type: str, raw_data: Any) -> bool:
+
+        if not isinstance(raw_data, dict) or "sample_id" not in raw_data:
+            return False
+
+        now = time.monotonic()
+        key = self._key(record_type, raw_data)
+
+        probable = self.filter.check_and_add(key, now)
+        duplicate = probable
+        if self.exact_confirm:
+            confirmed = self._confirm(key, now)
+            if probable and not confirmed:
+                self.metrics.record_dedup_event("false_positive")
+            duplicate = confirmed
+
+        self.metrics.record_dedup_event("suppressed" if duplicate else "passed")
+        self.metrics.set_dedup_memory(self.filter.memory_bytes)
+        return duplicate
@@ -1,7 +1,12 @@
-import asyncio
+import time
+
+_imports_begin = time.perf_counter()
 
+import asyncio
+from typing import Optional
 
 from src import config
+from src.runtime_config import runtime_config
 
 from communication import (
     genetic_input_queue,
@@ -11,6 +16,7 @@ from communication import (
 )
 
 from ingestion import (
+    DeduplicationStage,
     simulate_genetic_data_feed,
     simulate_biochemical_data_feed,
     simulate_physical_data_feed
@@ -32,10 +38,48 @@ from alerting import AlertManager
 
 from processing import DataOrchestrator
 
+from monitoring import LoopMonitor, MetricsCollector, tracer
+from communication.events import data_queue, discard_events
+
+_imports_ms = (time.perf_counter() - _imports_begin) * 1000
+
+
+def _bind_runtime_config(orchestrator: DataOrchestrator, loop_monitor: LoopMonitor):
+
+    # Solo lo que posee recursos necesita aplicar el cambio; los umbrales se
+    # leen de runtime_config.settings en cada uso.
+    input_queues = (genetic_input_queue, biochemical_input_queue, physical_input_queue)
+
+    runtime_config.subscribe("max_cpu_workers", orchestrator.resize_cpu_pool)
+    runtime_config.subscribe("max_io_workers", orchestrator.resize_io_pool)
+    runtime_config.subscribe(
+        "input_queue_maxsize", lambda size: [queue.resize(size) for queue in input_queues]
+    )
+    runtime_config.subscribe("processing_queue_maxsize", processing_queue.resize)
+    runtime_config.subscribe("trace_sample_rate", lambda rate: setattr(tracer, "sample_rate", rate))
+    runtime_config.subscribe(
+        "loop_block_threshold_ms", lambda ms: setattr(loop_monitor, "block_threshold_ms", ms)
+    )
+    runtime_config.subscribe("slo_latency_ms", orchestrator.overload.slo_ms.update)
+
+
+async def _record_time_to_first_record(startup_begin: float):
 
-async def main():
+    metrics = MetricsCollector()
+    while metrics.first_completion_at is None:
+        await asyncio.sleep(0.005)
+    first_record_ms = (metrics.first_completion_at - startup_begin) * 1000
+    metrics.record_startup_time("first_record", first_record_ms)
+    print(f"[Main] Primer registro procesado a los {first_record_ms:.2f} ms del arranque.")
+
+
+async def main(startup_begin: Optional[float] = None, headless: bool = False):
 
     print("--- Iniciando Sistema de Análisis de Umbrella Corporation ---")
+    # El lanzador pasa su propio instante inicial para contar también las importaciones.
+    if startup_begin is None:
+        startup_begin = _imports_begin
+    MetricsCollector().record_startup_time("main_imports", _imports_ms)
 
     tasks = []
 
@@ -43,6 +87,19 @@ async def main():
 
         alert_manager = AlertManager()
 
+        loop_monitor = LoopMonitor()
+        loop_monitor.register_queue("genetic_input", genetic_input_queue)
+        loop_monitor.register_queue("biochemical_input", biochemical_input_queue)
+        loop_monitor.register_queue("physical_input", physical_input_queue)
+        loop_monitor.register_queue("processing", processing_queue)
+        loop_monitor.register_queue("web_data", data_queue)
+        tasks.append(asyncio.create_task(loop_monitor.start()))
+        if headless:
+            tasks.append(asyncio.create_task(discard_events()))
+
+        # Compartido: las claves llevan el servicio como espacio de nombres.
+        deduplicator = DeduplicationStage()
+
         genetic_norm = GeneticNormalizer()
         biochem_norm = BiochemicalNormalizer()
         physical_norm = PhysicalNormalizer()
@@ -51,14 +108,16 @@ async def main():
             input_queue=genetic_input_queue,
             processing_queue=processing_queue,
             normalizer=genetic_norm,
-            alert_manager=alert_manager
+            alert_manager=alert_manager,
+            deduplicator=deduplicator
         )
 
         bioquimico_service = BioquimicoService(
             input_queue=biochemical_input_queue,
             processing_queue=processing_queue,
             normalizer=biochem_norm,
-            alert_manager=alert_manager
+            alert_manager=alert_manager,
+            deduplicator=deduplicator
         )
 
         fisico_service = FisicoService(
@@ -70,8 +129,15 @@ async def main():
 
         orchestrator = DataOrchestrator(
             processing_queue=processing_queue,
-            max_cpu_workers=config.MAX_CPU_WORKERS
+            max_cpu_workers=runtime_config.settings.max_cpu_workers,
+            max_io_workers=runtime_config.settings.max_io_workers,
+            alert_manager=alert_manager
         )
+        _bind_runtime_config(orchestrator, loop_monitor)
+        tasks.append(asyncio.create_task(runtime_config.track_throughput()))
+
+        # Los workers deben estar listos antes de aceptar datos.
+        await orchestrator.warm_up()
 
         tasks.append(asyncio.create_task(
             simulate_genetic_data_feed(genetic_input_queue, config.SIMULATION_SPEED)
@@ -88,6 +154,11 @@ async def main():
         tasks.append(asyncio.create_task(fisico_service.start()))
 
         orchestrator_task = asyncio.create_task(orchestrator.start())
+        tasks.append(asyncio.create_task(_record_time_to_first_record(startup_begin)))
+
+        startup_ms = (time.perf_counter() - startup_begin) * 1000
+        MetricsCollector().record_startup_time("system_startup", startup_ms)
+        print(f"[Main] Sistema listo en {startup_ms:.2f} ms.")
 
         print(f"Sistema en marcha. {len(tasks)} tareas de fondo + orquestador.")
         print("Presiona Ctrl+C para detener.")
@@ -108,11 +179,14 @@ async def main():
         if 'orchestrator' in locals():
             await orchestrator.shutdown()
 
+        for queue in (genetic_input_queue, biochemical_input_queue, physical_input_queue, processing_queue):
+            queue.close()
+
         print("--- Sistema de Análisis Detenido ---")
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(main(headless=True))
     except KeyboardInterrupt:
         print("\n[Main] Apagado forzado por el usuario.")
\ No newline at end of file
@@ -1,6 +1,12 @@
 
 from .metrics import MetricsCollector
+from .loop_monitor import LoopMonitor
+from .tracing import TraceContext, Tracer, tracer
 
 __all__ = [
-    "MetricsCollector"
+    "MetricsCollector",
+    "LoopMonitor",
+    "TraceContext",
+    "Tracer",
+    "tracer"
 ]
\ No newline at end of file
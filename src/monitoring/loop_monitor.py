@@ -0,0 +1,78 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from typing import Dict, Optional
+
+from src import config
+from .metrics import MetricsCollector
+
+
+class LoopMonitor:
+
+    def __init__(
+            self,
+            interval_sec: Optional[float] = None,
+            block_threshold_ms: Optional[float] = None
+    ):
+
+        self.interval_sec = interval_sec or config.LOOP_MONITOR_INTERVAL_SEC
+        self.block_threshold_ms = block_threshold_ms or config.LOOP_BLOCK_THRESHOLD_MS
+        self.queues: Dict[str, asyncio.Queue] = {}
+        self.metrics = MetricsCollector()
+
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def register_queue(self, name: str, queue: asyncio.Queue):
+        self.queues[name] = queue
+
+    def _sample_queues(self):
+        for name, queue in self.queues.items():
+            self.metrics.record_queue_depth(name, queue.qsize(), queue.maxsize)
+
+    def _watch(self):
+
+        # Hilo aparte: si el bucle no actualiza el latido a tiempo es que un
+        # callback lo está bloqueando; se captura la pila del hilo del bucle.
+        reported = False
+        while not self._stop.wait(self.interval_sec / 2):
+            stalled_ms = (time.monotonic() - self._heartbeat - self.interval_sec) * 1000
+            if stalled_ms < self.block_threshold_ms:
+                reported = False
+                continue
+            if reported:
+                continue
+            reported = True
+
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = traceback.format_stack(frame) if frame is not None else []
+            self.metrics.record_loop_block(stalled_ms, stack)
+            print(f"[LoopMonitor] Event loop bloqueado {stalled_ms:.0f} ms en: "
+                  f"{stack[-1].strip() if stack else 'desconocido'}")
+
+    async def start(self):
+
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+        print("[LoopMonitor] Iniciado.")
+        try:
+            while True:
+                expected = time.monotonic() + self.interval_sec
+                await asyncio.sleep(self.interval_sec)
+                now = time.monotonic()
+                self._heartbeat = now
+
+                self.metrics.record_loop_lag(max(now - expected, 0.0) * 1000)
+                self._sample_queues()
+        except asyncio.CancelledError:
+            print("[LoopMonitor] Detenido.")
+        finally:
+            self._stop.set()
@@ -1,7 +1,12 @@
 
 import threading
 import time
-from typing import Any, Dict, List
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+
+# Límites superiores (ms) de los buckets de los histogramas por etapa.
+STAGE_BUCKETS_MS: List[float] = [0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000, 5000, float("inf")]
 
 
 class MetricsCollector:
@@ -19,10 +24,24 @@ class MetricsCollector:
 
     def __init__(self):
 
+        # El singleton se reutiliza: no reiniciar los contadores en cada instancia.
+        if getattr(self, "_initialized", False):
+            return
+        self._initialized = True
+
         self.events_lock = threading.Lock()
         self.errors_lock = threading.Lock()
         self.latency_lock = threading.Lock()
         self.alert_lock = threading.Lock()
+        self.startup_lock = threading.Lock()
+        self.stage_lock = threading.Lock()
+        self.loop_lock = threading.Lock()
+        self.overload_lock = threading.Lock()
+        self.deadline_lock = threading.Lock()
+        self.dedup_lock = threading.Lock()
+        self.spill_lock = threading.Lock()
+        self.ws_lock = threading.Lock()
+        self.batch_lock = threading.Lock()
 
         self.events_processed: Dict[str, int] = {
             "total": 0,
@@ -45,6 +64,37 @@ class MetricsCollector:
 
         self.alert_stats: Dict[str, Any] = {"sum_ms": 0.0, "count": 0}
 
+        self.startup_stats: Dict[str, float] = {}
+
+        self.stage_stats: Dict[str, Dict[str, Any]] = {}
+
+        self.queue_stats: Dict[str, Dict[str, int]] = {}
+        self.loop_stats: Dict[str, Any] = {
+            "lag_ms": 0.0, "max_lag_ms": 0.0, "sum_lag_ms": 0.0, "samples": 0, "blocked_count": 0
+        }
+        self.loop_blocks: deque = deque(maxlen=10)
+
+        self.overload_stats: Dict[str, Dict[str, Any]] = {}
+
+        self.deadline_stats: Dict[str, Dict[str, int]] = {}
+
+        self.spill_stats: Dict[str, Dict[str, float]] = {}
+
+        self.ws_stats: Dict[str, Dict[str, int]] = {}
+        self.ws_connections = 0
+
+        self.batch_stats: Dict[str, Dict[str, float]] = {}
+
+        # Instante (perf_counter) del primer registro procesado.
+        self.first_completion_at: Optional[float] = None
+
+        self.dedup_stats: Dict[str, int] = {
+            "passed": 0,
+            "suppressed": 0,
+            "false_positive": 0,
+            "filter_bytes": 0
+        }
+
 
     def record_event(self, event_type: str):
 
@@ -67,6 +117,23 @@ class MetricsCollector:
                 stats = self.processing_stats[data_type]
                 stats["sum_ms"] += duration_ms
                 stats["count"] += 1
+                if self.first_completion_at is None:
+                    self.first_completion_at = time.perf_counter()
+
+    def record_processing_batch(self, data_type: str, durations_ms: List[float]):
+
+        with self.latency_lock:
+            if data_type in self.processing_stats:
+                stats = self.processing_stats[data_type]
+                stats["sum_ms"] += sum(durations_ms)
+                stats["count"] += len(durations_ms)
+                if durations_ms and self.first_completion_at is None:
+                    self.first_completion_at = time.perf_counter()
+
+    def get_completed_count(self) -> int:
+
+        with self.latency_lock:
+            return sum(stats["count"] for stats in self.processing_stats.values())
 
     def record_alert_latency(self, start_time: float):
 
@@ -75,10 +142,160 @@ class MetricsCollector:
             self.alert_stats["sum_ms"] += duration_ms
             self.alert_stats["count"] += 1
 
+    def record_startup_time(self, stage: str, duration_ms: float):
+
+        with self.startup_lock:
+            self.startup_stats[stage] = duration_ms
+
+
+    def record_stage_latency(self, stage: str, duration_ms: float):
+
+        with self.stage_lock:
+            stats = self.stage_stats.get(stage)
+            if stats is None:
+                stats = {"sum_ms": 0.0, "count": 0, "buckets": [0] * len(STAGE_BUCKETS_MS)}
+                self.stage_stats[stage] = stats
+            stats["sum_ms"] += duration_ms
+            stats["count"] += 1
+            for i, bound in enumerate(STAGE_BUCKETS_MS):
+                if duration_ms <= bound:
+                    stats["buckets"][i] += 1
+                    break
+
+    def record_queue_depth(self, name: str, depth: int, maxsize: int = 0):
+
+        with self.loop_lock:
+            stats = self.queue_stats.get(name)
+            if stats is None:
+                stats = {"depth": 0, "high_water": 0, "maxsize": maxsize}
+                self.queue_stats[name] = stats
+            stats["depth"] = depth
+            stats["maxsize"] = maxsize
+            if depth > stats["high_water"]:
+                stats["high_water"] = depth
+
+    def record_loop_lag(self, lag_ms: float):
+
+        with self.loop_lock:
+            self.loop_stats["lag_ms"] = lag_ms
+            self.loop_stats["sum_lag_ms"] += lag_ms
+            self.loop_stats["samples"] += 1
+            if lag_ms > self.loop_stats["max_lag_ms"]:
+                self.loop_stats["max_lag_ms"] = lag_ms
+
+    def record_loop_block(self, duration_ms: float, stack: List[str]):
+
+        with self.loop_lock:
+            self.loop_stats["blocked_count"] += 1
+            self.loop_blocks.append({"at": time.time(), "duration_ms": duration_ms, "stack": stack})
+
+    def _overload_entry(self, data_type: str) -> Dict[str, Any]:
+        entry = self.overload_stats.get(data_type)
+        if entry is None:
+            entry = {"latency_ewma_ms": 0.0, "slo_ms": 0.0, "degraded": False, "decisions": {}}
+            self.overload_stats[data_type] = entry
+        return entry
+
+    def record_overload_state(self, data_type: str, latency_ewma_ms: float, slo_ms: float, degraded: bool):
+
+        with self.overload_lock:
+            entry = self._overload_entry(data_type)
+            entry["latency_ewma_ms"] = latency_ewma_ms
+            entry["slo_ms"] = slo_ms
+            entry["degraded"] = degraded
+
+    def record_overload_decision(self, data_type: str, decision: str):
+
+        with self.overload_lock:
+            decisions = self._overload_entry(data_type)["decisions"]
+            decisions[decision] = decisions.get(decision, 0) + 1
+
+    def record_deadline_event(self, data_type: str, event: str):
+
+        with self.deadline_lock:
+            events = self.deadline_stats.setdefault(data_type, {})
+            events[event] = events.get(event, 0) + 1
+
+    def _spill_entry(self, name: str) -> Dict[str, float]:
+        entry = self.spill_stats.get(name)
+        if entry is None:
+            entry = {
+                "spilled_items": 0, "spilled_bytes": 0, "pending_bytes": 0,
+                "recovered_items": 0, "last_recovery_lag_ms": 0.0, "max_recovery_lag_ms": 0.0
+            }
+            self.spill_stats[name] = entry
+        return entry
+
+    def record_queue_spill(self, name: str, frame_bytes: int, pending_bytes: int):
+
+        with self.spill_lock:
+            entry = self._spill_entry(name)
+            entry["spilled_items"] += 1
+            entry["spilled_bytes"] += frame_bytes
+            entry["pending_bytes"] = pending_bytes
+
+    def record_queue_recovery(self, name: str, items: int, lag_ms: float, pending_bytes: int):
+
+        with self.spill_lock:
+            entry = self._spill_entry(name)
+            entry["recovered_items"] += items
+            entry["pending_bytes"] = pending_bytes
+            entry["last_recovery_lag_ms"] = lag_ms
+            if lag_ms > entry["max_recovery_lag_ms"]:
+                entry["max_recovery_lag_ms"] = lag_ms
+
+    def record_ws_publish(self, topic: str, sends: int, sent_bytes: int, rate_limited: int = 0):
+
+        with self.ws_lock:
+            stats = self.ws_stats.get(topic)
+            if stats is None:
+                stats = {"messages": 0, "sends": 0, "bytes": 0, "rate_limited": 0}
+                self.ws_stats[topic] = stats
+            stats["messages"] += 1
+            stats["sends"] += sends
+            stats["bytes"] += sent_bytes
+            stats["rate_limited"] += rate_limited
+
+    def record_batch(self, lane: str, size: int, persisted: int, io_ms: float, wait_ms: float):
+
+        with self.batch_lock:
+            stats = self.batch_stats.get(lane)
+            if stats is None:
+                stats = {
+                    "batches": 0, "records": 0, "persisted": 0, "max_size": 0,
+                    "io_sum_ms": 0.0, "max_io_ms": 0.0, "wait_sum_ms": 0.0, "max_wait_ms": 0.0
+                }
+                self.batch_stats[lane] = stats
+            stats["batches"] += 1
+            stats["records"] += size
+            stats["persisted"] += persisted
+            stats["max_size"] = max(stats["max_size"], size)
+            stats["io_sum_ms"] += io_ms
+            stats["max_io_ms"] = max(stats["max_io_ms"], io_ms)
+            stats["wait_sum_ms"] += wait_ms
+            stats["max_wait_ms"] = max(stats["max_wait_ms"], wait_ms)
+
+    def set_ws_connections(self, connections: int):
+
+        with self.ws_lock:
+            self.ws_connections = connections
+
+    def record_dedup_event(self, event: str):
+
+        with self.dedup_lock:
+            self.dedup_stats[event] = self.dedup_stats.get(event, 0) + 1
+
+    def set_dedup_memory(self, filter_bytes: int):
+
+        with self.dedup_lock:
+            self.dedup_stats["filter_bytes"] = filter_bytes
 
     def get_current_stats(self) -> Dict[str, Any]:
 
-        with self.events_lock, self.errors_lock, self.latency_lock, self.alert_lock:
+        with self.events_lock, self.errors_lock, self.latency_lock, self.alert_lock, self.startup_lock, \
+                self.stage_lock, self.loop_lock, self.overload_lock, \
+                self.deadline_lock, self.dedup_lock, self.spill_lock, \
+                self.ws_lock, self.batch_lock:
             events = self.events_processed.copy()
             errors = self.errors_count.copy()
 
@@ -87,6 +304,43 @@ class MetricsCollector:
                 count = stats['count']
                 avg_processing[dtype] = (stats['sum_ms'] / count) if count > 0 else 0.0
 
+            stage_latency = {
+                stage: {
+                    "count": stats["count"],
+                    "average_ms": stats["sum_ms"] / stats["count"],
+                    "buckets": {
+                        ("inf" if bound == float("inf") else f"{bound:g}"): n
+                        for bound, n in zip(STAGE_BUCKETS_MS, stats["buckets"])
+                    }
+                }
+                for stage, stats in self.stage_stats.items()
+            }
+
+            samples = self.loop_stats["samples"]
+            event_loop = {
+                "lag_ms": self.loop_stats["lag_ms"],
+                "max_lag_ms": self.loop_stats["max_lag_ms"],
+                "average_lag_ms": (self.loop_stats["sum_lag_ms"] / samples) if samples > 0 else 0.0,
+                "blocked_count": self.loop_stats["blocked_count"],
+                "recent_blocks": list(self.loop_blocks)
+            }
+
+            batches = {
+                lane: {
+                    "batches": stats["batches"],
+                    "records": stats["records"],
+                    "persisted": stats["persisted"],
+                    "average_size": stats["records"] / stats["batches"],
+                    "max_size": stats["max_size"],
+                    "average_io_ms": stats["io_sum_ms"] / stats["batches"],
+                    "max_io_ms": stats["max_io_ms"],
+                    "io_ms_per_record": (stats["io_sum_ms"] / stats["persisted"]) if stats["persisted"] else 0.0,
+                    "average_wait_ms": stats["wait_sum_ms"] / stats["batches"],
+                    "max_wait_ms": stats["max_wait_ms"]
+                }
+                for lane, stats in self.batch_stats.items()
+            }
+
             alert_count = self.alert_stats['count']
             avg_alert = (self.alert_stats['sum_ms'] / alert_count) if alert_count > 0 else 0.0
 
@@ -94,5 +348,21 @@ class MetricsCollector:
                 "events_processed": events,
                 "errors_count": errors,
                 "average_processing_latency_ms": avg_processing,
-                "average_alert_latency_ms": avg_alert
+                "average_alert_latency_ms": avg_alert,
+                "startup_ms": self.startup_stats.copy(),
+                "stage_latency_ms": stage_latency,
+                "queues": {name: stats.copy() for name, stats in self.queue_stats.items()},
+                "batches": batches,
+                "queue_spill": {name: stats.copy() for name, stats in self.spill_stats.items()},
+                "event_loop": event_loop,
+                "dedup": self.dedup_stats.copy(),
+                "websocket": {
+                    "connections": self.ws_connections,
+                    "topics": {topic: stats.copy() for topic, stats in self.ws_stats.items()}
+                },
+                "deadlines": {data_type: events.copy() for data_type, events in self.deadline_stats.items()},
+                "overload": {
+                    data_type: {**entry, "decisions": entry["decisions"].copy()}
+                    for data_type, entry in self.overload_stats.items()
+                }
             }
\ No newline at end of file
@@ -0,0 +1,106 @@
+import json
+import random
+import threading
+import time
+from collections import deque
+from itertools import count
+from typing import Any, Dict, List, Optional, Tuple
+
+from src import config
+from .metrics import MetricsCollector
+
+
+class TraceContext:
+
+    # Cada marca cierra la etapa que empezó en la marca anterior.
+    __slots__ = ("trace_id", "record_type", "key", "marks")
+
+    def __init__(self, trace_id: int, record_type: str, key: str):
+        self.trace_id = trace_id
+        self.record_type = record_type
+        self.key = key
+        self.marks: List[Tuple[str, int]] = [("ingested", time.perf_counter_ns())]
+
+    def mark(self, stage: str):
+        self.marks.append((stage, time.perf_counter_ns()))
+
+    def spans(self) -> List[Tuple[str, int, int]]:
+        # (etapa, inicio_ns, duración_ns)
+        return [
+            (stage, self.marks[i - 1][1], t - self.marks[i - 1][1])
+            for i, (stage, t) in enumerate(self.marks)
+            if i > 0
+        ]
+
+
+class Tracer:
+
+    def __init__(self, sample_rate: Optional[float] = None, buffer_size: Optional[int] = None):
+
+        self.sample_rate = config.TRACE_SAMPLE_RATE if sample_rate is None else sample_rate
+        self._ids = count(1)
+        self._finished: deque = deque(maxlen=buffer_size or config.TRACE_BUFFER_SIZE)
+        self._lock = threading.Lock()
+        self._epoch_ns = time.perf_counter_ns()
+        self.metrics = MetricsCollector()
+
+    def start(self, record_type: str, key: str) -> Optional[TraceContext]:
+
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return None
+        return TraceContext(next(self._ids), record_type, key)
+
+    def finish(self, ctx: Optional[TraceContext]):
+
+        if ctx is None:
+            return
+
+        for stage, _, duration_ns in ctx.spans():
+            self.metrics.record_stage_latency(stage, duration_ns / 1e6)
+
+        with self._lock:
+            self._finished.append(ctx)
+
+    def export_chrome_trace(self) -> Dict[str, Any]:
+
+        # Formato "Trace Event" (chrome://tracing / Perfetto): un evento
+        # completo ("X") por etapa y una fila (tid) por registro, agrupadas
+        # en un proceso (pid) por tipo de dato.
+        with self._lock:
+            finished = list(self._finished)
+
+        pids: Dict[str, int] = {}
+        events: List[Dict[str, Any]] = []
+        for ctx in finished:
+            pid = pids.setdefault(ctx.record_type, len(pids) + 1)
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": ctx.trace_id,
+                "args": {"name": ctx.key}
+            })
+            for stage, start_ns, duration_ns in ctx.spans():
+                events.append({
+                    "name": stage,
+                    "cat": ctx.record_type,
+                    "ph": "X",
+                    "ts": (start_ns - self._epoch_ns) / 1000,
+                    "dur": duration_ns / 1000,
+                    "pid": pid,
+                    "tid": ctx.trace_id,
+                    "args": {"trace_id": ctx.trace_id, "key": ctx.key}
+                })
+
+        for record_type, pid in pids.items():
+            events.append({
+                "name": "process_name", "ph": "M", "pid": pid,
+                "args": {"name": record_type}
+            })
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str):
+
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.export_chrome_trace(), f)
+
+
+tracer = Tracer()
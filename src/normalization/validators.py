@@ -1,14 +1,16 @@
 
+import time
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Set
 from pydantic import BaseModel, Field, ValidationError, field_validator
 
+from communication.records import BiochemicalRecord, GeneticRecord, PhysicalRecord
 
 
 class DataNormalizer(ABC):
 
     @abstractmethod
-    def normalize(self, raw_data: Any) -> Dict[str, Any]:
+    def normalize(self, raw_data: Any) -> Any:
         pass
 
 
@@ -34,9 +36,14 @@ class PhysicalDataModel(BaseModel):
     type: str = "physical"
 
 
+def _ingested_at(raw_data: Any) -> float:
+    ingested_at = raw_data.get("ingested_at") if isinstance(raw_data, dict) else None
+    return float(ingested_at) if ingested_at else time.time()
+
+
 class GeneticNormalizer(DataNormalizer):
 
-    def normalize(self, raw_data: Any) -> Dict[str, Any]:
+    def normalize(self, raw_data: Any) -> GeneticRecord:
         try:
             if "raw_sequence" in raw_data:
                 sequence = raw_data["raw_sequence"].strip().replace(" ", "").upper()
@@ -49,7 +56,15 @@ class GeneticNormalizer(DataNormalizer):
             if "G" in model.sequence:
                 model.detected_mutations.add("G-VIRUS")
 
-            return model.model_dump()
+            source_lab = (model.metadata or {}).get("source_lab")
+
+            return GeneticRecord(
+                sample_id=model.sample_id,
+                sequence=model.sequence,
+                detected_mutations=tuple(sorted(model.detected_mutations)),
+                source_lab=source_lab,
+                ingested_at=_ingested_at(raw_data)
+            )
 
         except ValidationError as e:
             raise ValueError(f"Datos genéticos inválidos: {e}")
@@ -71,7 +86,7 @@ class BiochemicalNormalizer(DataNormalizer):
             except (ValueError, IndexError):
                 raise ValueError("Formato de toxin_level inválido")
 
-    def normalize(self, raw_data: Any) -> Dict[str, Any]:
+    def normalize(self, raw_data: Any) -> BiochemicalRecord:
         try:
             input_model = self.BiochemicalInput.model_validate(raw_data)
 
@@ -82,7 +97,12 @@ class BiochemicalNormalizer(DataNormalizer):
             }
 
             model = BiochemicalDataModel.model_validate(output_data)
-            return model.model_dump()
+            return BiochemicalRecord(
+                sample_id=model.sample_id,
+                toxin_level=model.toxin_level,
+                protein_x_level=model.protein_x_level,
+                ingested_at=_ingested_at(raw_data)
+            )
 
         except ValidationError as e:
             raise ValueError(f"Datos bioquímicos inválidos: {e}")
@@ -90,7 +110,7 @@ class BiochemicalNormalizer(DataNormalizer):
 
 class PhysicalNormalizer(DataNormalizer):
 
-    def normalize(self, raw_data: Any) -> Dict[str, Any]:
+    def normalize(self, raw_data: Any) -> PhysicalRecord:
         try:
             subject_id = raw_data.get("subject_id")
             if not subject_id:
@@ -112,7 +132,12 @@ class PhysicalNormalizer(DataNormalizer):
             }
 
             model = PhysicalDataModel.model_validate(normalized_data)
-            return model.model_dump()
+            return PhysicalRecord(
+                subject_id=model.subject_id,
+                heart_rate=model.heart_rate,
+                spo2=model.spo2,
+                ingested_at=_ingested_at(raw_data)
+            )
 
         except ValidationError as e:
             raise ValueError(f"Datos físicos inválidos: {e}")
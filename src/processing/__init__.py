@@ -1,6 +1,22 @@
-
-from .orchestrator import DataOrchestrator
+# Todo se importa de forma perezosa: los workers del pool de CPU solo
+# necesitan `processing.cpu_tasks` y no deben arrastrar la pila web.
 
 __all__ = [
-    "DataOrchestrator"
-]
\ No newline at end of file
+    "DataOrchestrator",
+    "ExecutorPools",
+    "TaskRegistry",
+    "TaskSpec"
+]
+
+
+def __getattr__(name):
+    if name == "DataOrchestrator":
+        from .orchestrator import DataOrchestrator
+        return DataOrchestrator
+    if name == "ExecutorPools":
+        from .executors import ExecutorPools
+        return ExecutorPools
+    if name in ("TaskRegistry", "TaskSpec"):
+        from . import task_registry
+        return getattr(task_registry, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,38 +1,107 @@
 
+import os
+import signal
 import time
-from typing import Dict, Any
 
+from communication import codec
+from communication.records import AnalysisResult, BiochemicalRecord, GeneticRecord
 
-def _simulate_heavy_computation(duration_sec: float):
+
+# Intervalo entre comprobaciones de cancelación dentro del cálculo.
+CANCEL_CHECK_SEC = 0.05
+
+_warm_up_barrier = None
+_cancel_event = None
+
+
+class AnalysisCancelled(Exception):
+    pass
+
+
+def init_worker(warm_up_barrier=None, cancel_event=None, cpus=None):
+    global _warm_up_barrier, _cancel_event
+    _warm_up_barrier = warm_up_barrier
+    _cancel_event = cancel_event
+    # Ctrl+C llega a todo el grupo de procesos: el apagado lo gobierna el
+    # proceso principal con la señal de cancelación.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    # Afinidad opcional del pool; no existe en todas las plataformas.
+    if cpus and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cpus)
+
+
+def warm_up_worker(rendezvous: bool = False, timeout_sec: float = 30.0) -> int:
+    # Con rendezvous cada worker queda retenido hasta que todos han llegado,
+    # de modo que el pool no puede repartir dos tareas de calentamiento al mismo.
+    if rendezvous and _warm_up_barrier is not None:
+        _warm_up_barrier.wait(timeout_sec)
+    return os.getpid()
+
+
+def _simulate_heavy_computation(duration_sec: float, deadline: float = 0.0):
+    # Trabajo troceado: entre trozos se consulta la señal compartida de
+    # cancelación y el deadline del registro, liberando el worker al momento.
     start_time = time.perf_counter()
     while (time.perf_counter() - start_time) < duration_sec:
-        _ = 1 + 1
+        chunk_end = min(time.perf_counter() + CANCEL_CHECK_SEC, start_time + duration_sec)
+        while time.perf_counter() < chunk_end:
+            _ = 1 + 1
+
+        if _cancel_event is not None and _cancel_event.is_set():
+            raise AnalysisCancelled("apagado")
+        if deadline and time.time() > deadline:
+            raise AnalysisCancelled("deadline")
+
+
+def analyze_genetic_sequence(data: GeneticRecord) -> AnalysisResult:
+
+    _simulate_heavy_computation(2.0, data.deadline)
+
+    return AnalysisResult(
+        analysis_id=f"res_{data.sample_id}",
+        analysis_type="genetic",
+        sample_id=data.sample_id,
+        finding="Mutación T-Virus detectada" if "T" in data.sequence else "Estable",
+        source_lab=data.source_lab
+    )
+
+
+def screen_genetic_sequence(data: GeneticRecord) -> AnalysisResult:
+
+    # Cribado barato para modo degradado: solo marcadores ya detectados.
+    _simulate_heavy_computation(0.3, data.deadline)
+
+    return AnalysisResult(
+        analysis_id=f"res_{data.sample_id}",
+        analysis_type="genetic",
+        sample_id=data.sample_id,
+        finding="Cribado: mutación T-Virus" if "T-VIRUS" in data.detected_mutations else "Cribado: estable",
+        source_lab=data.source_lab
+    )
+
+
+def analyze_biochemical_model(data: BiochemicalRecord) -> AnalysisResult:
+
+    _simulate_heavy_computation(1.5, data.deadline)
 
+    return AnalysisResult(
+        analysis_id=f"res_{data.sample_id}",
+        analysis_type="biochemical",
+        sample_id=data.sample_id,
+        finding="Niveles de toxina inestables",
+        toxin_level=data.toxin_level
+    )
 
-def analyze_genetic_sequence(data: Dict[str, Any]) -> Dict[str, Any]:
-    sample_id = data.get('sample_id', 'unknown')
-    sequence = data.get('sequence', '')
 
-    _simulate_heavy_computation(2.0)
+# Variantes para el pool de procesos: la IPC viaja con el codec binario.
 
-    result = {
-        "analysis_id": f"res_{sample_id}",
-        "source_data": data,
-        "finding": "Mutación T-Virus detectada" if "T" in sequence else "Estable",
-        "analysis_type": "genetic"
-    }
-    return result
+def analyze_genetic_packed(payload: bytes) -> bytes:
+    return codec.encode(analyze_genetic_sequence(codec.decode(payload)))
 
 
-def analyze_biochemical_model(data: Dict[str, Any]) -> Dict[str, Any]:
-    sample_id = data.get('sample_id', 'unknown')
+def screen_genetic_packed(payload: bytes) -> bytes:
+    return codec.encode(screen_genetic_sequence(codec.decode(payload)))
 
-    _simulate_heavy_computation(1.5)
 
-    result = {
-        "analysis_id": f"res_{sample_id}",
-        "source_data": data,
-        "finding": "Niveles de toxina inestables",
-        "analysis_type": "biochemical"
-    }
-    return result
\ No newline at end of file
+def analyze_biochemical_packed(payload: bytes) -> bytes:
+    return codec.encode(analyze_biochemical_model(codec.decode(payload)))
@@ -0,0 +1,259 @@
+import asyncio
+import itertools
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from src import config
+from communication import codec
+from . import cpu_tasks
+from .task_registry import INLINE, PROCESS, TaskRegistry, TaskSpec
+
+SHARED_POOL = "shared"
+
+
+def _create_cpu_executor(
+        max_workers: int,
+        cpus: Optional[Tuple[int, ...]] = None
+) -> Tuple[ProcessPoolExecutor, Any]:
+
+    method = config.CPU_START_METHOD
+    if method not in multiprocessing.get_all_start_methods():
+        method = "spawn"
+
+    mp_context = multiprocessing.get_context(method)
+    if method == "forkserver":
+        mp_context.set_forkserver_preload(list(config.CPU_PRELOAD_MODULES))
+
+    # Barrera y señal de cancelación se heredan vía initargs: es la única
+    # forma de compartir primitivas de sincronización con los workers.
+    warm_up_barrier = mp_context.Barrier(max_workers)
+    cancel_event = mp_context.Event()
+
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=mp_context,
+        initializer=cpu_tasks.init_worker,
+        initargs=(warm_up_barrier, cancel_event, cpus)
+    )
+    return executor, cancel_event
+
+
+def split_workers(total: int, weights: Dict[str, float]) -> Dict[str, int]:
+
+    # Reparto proporcional al peso, con al menos un worker por pool.
+    weight_sum = sum(weights.values()) or 1.0
+    return {name: max(1, round(total * weight / weight_sum)) for name, weight in weights.items()}
+
+
+class ProcessPool:
+
+    __slots__ = ("name", "executor", "cancel_event", "workers", "cpus")
+
+    def __init__(self, name: str, workers: int, cpus: Optional[Tuple[int, ...]] = None):
+        self.name = name
+        self.workers = workers
+        self.cpus = cpus
+        self.executor, self.cancel_event = _create_cpu_executor(workers, cpus)
+
+
+class FairShareScheduler:
+
+    # Reparto ponderado de un pool común (start-time fair queueing): cada
+    # tarea recibe una etiqueta virtual de inicio y se despacha la menor.
+    # Una tarea solo entra al pool cuando hay un hueco libre, de modo que una
+    # ráfaga de un tipo no se cuela delante del resto en la cola FIFO del pool.
+
+    def __init__(self, slots: int, weights: Dict[str, float], alpha: float = 0.2):
+
+        self.slots = slots
+        self.weights = dict(weights)
+        self.alpha = alpha
+        self._busy = 0
+        self._vtime = 0.0
+        self._finish: Dict[str, float] = {}
+        self._cost: Dict[str, float] = {}
+        self._waiting: Dict[str, deque] = {}
+        self._seq = itertools.count()
+
+    def _tag(self, data_type: str) -> float:
+
+        # El coste es la duración media observada: el reparto es de tiempo de
+        # pool, no de número de tareas.
+        start = max(self._vtime, self._finish.get(data_type, 0.0))
+        self._finish[data_type] = start + self._cost.get(data_type, 1.0) / self.weights.get(data_type, 1.0)
+        return start
+
+    async def acquire(self, data_type: str):
+
+        start = self._tag(data_type)
+        if self._busy < self.slots and not any(self._waiting.values()):
+            self._busy += 1
+            self._vtime = start
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiting.setdefault(data_type, deque()).append((start, next(self._seq), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(data_type)
+            raise
+
+    def release(self, data_type: str, duration_sec: Optional[float] = None):
+
+        if duration_sec is not None:
+            previous = self._cost.get(data_type)
+            self._cost[data_type] = duration_sec if previous is None \
+                else previous + self.alpha * (duration_sec - previous)
+        self._busy -= 1
+        self._dispatch()
+
+    def resize(self, slots: int):
+        self.slots = slots
+        self._dispatch()
+
+    def _dispatch(self):
+
+        while self._busy < self.slots:
+            heads = [(queue[0], t) for t, queue in self._waiting.items() if queue]
+            if not heads:
+                return
+            (start, _, waiter), data_type = min(heads)
+            self._waiting[data_type].popleft()
+            if waiter.done():
+                continue
+            self._busy += 1
+            self._vtime = start
+            waiter.set_result(None)
+
+
+class ExecutorPools:
+
+    def __init__(
+            self,
+            registry: TaskRegistry,
+            max_cpu_workers: int = config.MAX_CPU_WORKERS,
+            max_io_workers: int = config.MAX_IO_WORKERS,
+            mode: Optional[str] = None,
+            weights: Optional[Dict[str, float]] = None,
+            affinity: Optional[Dict[str, Tuple[int, ...]]] = None
+    ):
+
+        self.registry = registry
+        self.mode = mode or config.CPU_POOL_MODE
+        if self.mode not in ("isolated", SHARED_POOL):
+            raise ValueError(f"Modo de pool CPU desconocido: {self.mode}")
+
+        process_types = registry.types(PROCESS)
+        configured = weights or config.CPU_POOL_WEIGHTS
+        self.weights = {t: configured.get(t, 1.0) for t in process_types}
+        self.affinity = dict(config.CPU_AFFINITY if affinity is None else affinity)
+        self.max_cpu_workers = max_cpu_workers
+
+        self.pools: Dict[str, ProcessPool] = {}
+        for name, workers in self._pool_sizes(max_cpu_workers).items():
+            self.pools[name] = ProcessPool(name, workers, self.affinity.get(name))
+        self.scheduler = FairShareScheduler(max_cpu_workers, self.weights) \
+            if self.mode == SHARED_POOL else None
+
+        # Señales de pools ya sustituidos que aún pueden tener análisis en curso.
+        self._retired_cancel_events: List[Any] = []
+
+        self.max_io_workers = max_io_workers
+        self.thread_executor = ThreadPoolExecutor(max_workers=max_io_workers)
+
+    def _pool_sizes(self, total: int) -> Dict[str, int]:
+        if not self.weights:
+            return {}
+        if self.mode == SHARED_POOL:
+            return {SHARED_POOL: total}
+        return split_workers(total, self.weights)
+
+    def pool_for(self, data_type: str) -> ProcessPool:
+        return self.pools[SHARED_POOL if self.mode == SHARED_POOL else data_type]
+
+    async def run(self, spec: TaskSpec, record: Any, degraded: bool = False) -> Any:
+
+        func, packed = spec.resolve(degraded)
+        if spec.backend == INLINE:
+            return func(record)
+
+        loop = asyncio.get_running_loop()
+        if spec.backend != PROCESS:
+            return await loop.run_in_executor(self.thread_executor, func, record)
+
+        payload = codec.encode(record) if packed else record
+        if self.scheduler is None:
+            output = await loop.run_in_executor(self.pool_for(spec.data_type).executor, func, payload)
+        else:
+            await self.scheduler.acquire(spec.data_type)
+            # El pool se resuelve tras la espera: pudo sustituirse entretanto.
+            start_time = time.perf_counter()
+            try:
+                output = await loop.run_in_executor(self.pool_for(spec.data_type).executor, func, payload)
+            finally:
+                self.scheduler.release(spec.data_type, time.perf_counter() - start_time)
+        return codec.decode(output) if packed else output
+
+    async def prewarm(self, pool: ProcessPool) -> List[int]:
+
+        # Cada tarea espera en la barrera, así que el pool levanta un worker por tarea.
+        loop = asyncio.get_running_loop()
+        try:
+            return await asyncio.gather(*(
+                loop.run_in_executor(pool.executor, cpu_tasks.warm_up_worker, True)
+                for _ in range(pool.workers)
+            ))
+        except Exception as e:
+            print(f"[Orchestrator] AVISO: fallo en la sincronización de workers CPU ({pool.name}): {e}")
+            return []
+
+    async def resize_cpu(self, total: int):
+
+        if total == self.max_cpu_workers:
+            return
+
+        # Cada pool que cambia de tamaño se sustituye por uno nuevo ya
+        # precalentado; lo ya enviado al antiguo termina allí.
+        for name, workers in self._pool_sizes(total).items():
+            old = self.pools[name]
+            if workers == old.workers:
+                continue
+            new = ProcessPool(name, workers, old.cpus)
+            pids = await self.prewarm(new)
+            self.pools[name] = new
+            self._retired_cancel_events.append(old.cancel_event)
+            old.executor.shutdown(wait=False)
+            print(f"[Orchestrator] Pool CPU '{name}' redimensionado a {workers} workers "
+                  f"({len(set(pids))} precalentados).")
+
+        self.max_cpu_workers = total
+        if self.scheduler is not None:
+            self.scheduler.resize(total)
+
+    def resize_threads(self, max_workers: int):
+
+        if max_workers == self.max_io_workers:
+            return
+
+        old_executor = self.thread_executor
+        self.thread_executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.max_io_workers = max_workers
+        old_executor.shutdown(wait=False)
+
+        print(f"[Orchestrator] Pool I/O redimensionado a {max_workers} hilos.")
+
+    def shutdown(self):
+
+        # Los análisis en curso abortan en su siguiente trozo de cálculo.
+        for pool in self.pools.values():
+            pool.cancel_event.set()
+        for cancel_event in self._retired_cancel_events:
+            cancel_event.set()
+        self.thread_executor.shutdown(wait=True)
+        for pool in self.pools.values():
+            pool.executor.shutdown(wait=True, cancel_futures=True)
@@ -1,26 +1,41 @@
 
 import asyncio
-import time
-from typing import Dict, Any
+from typing import List
 
+from src import config
+from communication.records import AnalysisResult, PhysicalRecord
+from storage import RecordStore
 
-async def save_analysis_to_db_async(result: Dict[str, Any]):
+results_store = RecordStore(config.RESULTS_STORE_PATH)
+vitals_store = RecordStore(config.VITALS_STORE_PATH)
 
-    analysis_id = result.get('analysis_id', 'unknown')
+
+async def save_analysis_to_db_async(result: AnalysisResult):
+
+    analysis_id = result.analysis_id
     print(f"    [I/O-Async] Guardando resultado {analysis_id} en BBDD...")
 
-    await asyncio.sleep(0.5)
+    await asyncio.to_thread(results_store.append, [result])
 
     print(f"    [I/O-Async] Resultado {analysis_id} guardado.")
 
 
-def save_vitals_to_file_sync(data: Dict[str, Any]):
+def save_vitals_to_file_sync(data: PhysicalRecord):
 
-    subject_id = data.get('subject_id', 'unknown')
+    subject_id = data.subject_id
 
     try:
-        time.sleep(0.5)
+        vitals_store.append([data])
 
     except Exception as e:
-        print(f"    [I/O-Thread] Error al escribir log: {e}")
+        print(f"    [I/O-Thread] Error al escribir log de {subject_id}: {e}")
+
+
 
+def save_vitals_batch_sync(records: List[PhysicalRecord]):
+
+    try:
+        vitals_store.append(records)
+
+    except Exception as e:
+        print(f"    [I/O-Thread] Error al escribir lote de {len(records)} constantes vitales: {e}")
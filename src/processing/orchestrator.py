@@ -2,87 +2,117 @@
 import asyncio
 import time
 from asyncio import Queue
-from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Tuple
 
+from src import config
 from . import io_tasks, cpu_tasks
-from web.connection_manager import data_queue
-from monitoring import MetricsCollector
+from .executors import ExecutorPools, ProcessPool
+from .overload import ADMIT, DEGRADE, OverloadController
+from .physical_lane import PhysicalLane
+from .task_registry import TaskRegistry, default_registry
+from communication.events import data_queue
+from monitoring import MetricsCollector, tracer
 
 
 class DataOrchestrator:
 
-    def __init__(self, processing_queue: Queue, max_cpu_workers: int = 4):
+    def __init__(
+            self,
+            processing_queue: Queue,
+            max_cpu_workers: int = config.MAX_CPU_WORKERS,
+            max_io_workers: int = config.MAX_IO_WORKERS,
+            registry: Optional[TaskRegistry] = None,
+            alert_manager: Any = None
+    ):
 
         self.processing_queue = processing_queue
 
-        self.cpu_executor = ProcessPoolExecutor(max_workers=max_cpu_workers)
-
-        self.io_executor = ThreadPoolExecutor(max_workers=10)
+        self.registry = registry or default_registry()
+        self.pools = ExecutorPools(self.registry, max_cpu_workers, max_io_workers)
 
         self._is_running = False
+        self._is_shut_down = False
         self.metrics = MetricsCollector()
+        self.overload = OverloadController()
+        self.physical_lane = PhysicalLane(self.pools, self.overload, alert_manager)
 
-    async def _route_and_process_task(self, data: Dict[str, Any]):
+    @property
+    def io_executor(self) -> ThreadPoolExecutor:
+        return self.pools.thread_executor
 
-        try:
-            data_type = data.get("type", "unknown")
-            loop = asyncio.get_running_loop()
+    async def _warm_up_pool(self, pool: ProcessPool) -> Tuple[float, float]:
 
-            result = None
-            start_time = time.perf_counter()
+        loop = asyncio.get_running_loop()
 
-            if data_type == "genetic":
-                result = await loop.run_in_executor(
-                    self.cpu_executor,
-                    cpu_tasks.analyze_genetic_sequence,
-                    data
-                )
-                duration_ms = (time.perf_counter() - start_time) * 1000
-                self.metrics.record_processing_time("genetic", duration_ms)
+        # Primera tarea sobre el pool en frío: incluye el arranque del worker.
+        start_time = time.perf_counter()
+        first_pid = await loop.run_in_executor(pool.executor, cpu_tasks.warm_up_worker)
+        cold_ms = (time.perf_counter() - start_time) * 1000
 
-                print(f"[Orchestrator] Enviando latencia genética: {duration_ms:.2f} ms")  # <--- Log de depuración
-                await data_queue.put({
-                    "type": "latency",
-                    "label": "Genetic",
-                    "value": duration_ms
-                })
+        pids = await self.pools.prewarm(pool) or [first_pid]
+        warmed_workers = len(set(pids))
+        live_workers = len(pool.executor._processes)
 
-            elif data_type == "biochemical":
-                result = await loop.run_in_executor(
-                    self.cpu_executor,
-                    cpu_tasks.analyze_biochemical_model,
-                    data
-                )
-                duration_ms = (time.perf_counter() - start_time) * 1000
-                self.metrics.record_processing_time("biochemical", duration_ms)
+        start_time = time.perf_counter()
+        await loop.run_in_executor(pool.executor, cpu_tasks.warm_up_worker)
+        warm_ms = (time.perf_counter() - start_time) * 1000
 
-                print(f"[Orchestrator] Enviando latencia bioquímica: {duration_ms:.2f} ms")  # <--- Log de depuración
-                await data_queue.put({
-                    "type": "latency",
-                    "label": "Biochemical",
-                    "value": duration_ms
-                })
+        if warmed_workers < pool.workers or live_workers < pool.workers:
+            print(f"[Orchestrator] AVISO: solo {warmed_workers} de {pool.workers} workers CPU "
+                  f"precalentados en '{pool.name}' ({live_workers} procesos vivos).")
+
+        print(f"[Orchestrator] Pool CPU '{pool.name}' precalentado: {warmed_workers} workers "
+              f"(primera tarea en frío {cold_ms:.2f} ms, primera tarea en caliente {warm_ms:.2f} ms)")
+        return cold_ms, warm_ms
 
-            elif data_type == "physical":
-                print(f"[Orchestrator] Delegando Tarea I/O (Física): {data['subject_id']}")
-                await loop.run_in_executor(
-                    self.io_executor,
-                    io_tasks.save_vitals_to_file_sync,
-                    data
-                )
+    async def warm_up(self):
 
+        timings = await asyncio.gather(*(self._warm_up_pool(pool) for pool in self.pools.pools.values()))
+        if timings:
+            self.metrics.record_startup_time("cpu_pool_cold_start", max(cold for cold, _ in timings))
+            self.metrics.record_startup_time("cpu_first_task_warm", max(warm for _, warm in timings))
+
+    async def resize_cpu_pool(self, max_workers: int):
+        await self.pools.resize_cpu(max_workers)
+
+    def resize_io_pool(self, max_workers: int):
+        self.pools.resize_threads(max_workers)
+
+    async def _route_and_process_task(self, data: Any):
+
+        try:
+            data_type = getattr(data, "type", "unknown")
+            trace = getattr(data, "trace", None)
+
+            # Un resultado fuera de plazo no sirve: ni siquiera se despacha.
+            if data.deadline and time.time() > data.deadline:
+                self.metrics.record_deadline_event(data_type, "expired_before_dispatch")
+                return
+
+            decision = self.overload.decide(data) if data_type in self.overload.slo_ms else ADMIT
+            if decision not in (ADMIT, DEGRADE):
+                return
+
+            result = None
+            start_time = time.perf_counter()
+
+            spec = self.registry.get(data_type)
+            if spec is not None:
+                result = await self.pools.run(spec, data, degraded=decision == DEGRADE)
                 duration_ms = (time.perf_counter() - start_time) * 1000
-                self.metrics.record_processing_time("physical", duration_ms)
+                result.latency_ms = duration_ms
+                self.metrics.record_processing_time(data_type, duration_ms)
+                self.overload.observe(data_type, duration_ms)
+                if trace is not None:
+                    trace.mark("executor")
 
-                print(f"[Orchestrator] Enviando latencia física: {duration_ms:.2f} ms")
+                print(f"[Orchestrator] Enviando latencia {data_type}: {duration_ms:.2f} ms")
                 await data_queue.put({
                     "type": "latency",
-                    "label": "Physical",
+                    "label": spec.label,
                     "value": duration_ms
                 })
-                # ---------------------
-                return  #
 
             else:
                 print(f"[Orchestrator] ERROR: Tipo de dato desconocido: {data_type}")
@@ -90,6 +120,13 @@ class DataOrchestrator:
 
             if result:
                 await io_tasks.save_analysis_to_db_async(result)
+                if trace is not None:
+                    trace.mark("persistence")
+                    tracer.finish(trace)
+
+        except cpu_tasks.AnalysisCancelled as e:
+            self.metrics.record_deadline_event(getattr(data, "type", "unknown"), f"cancelled_{e}")
+            print(f"[Orchestrator] Análisis cancelado ({e}): {data}")
 
         except Exception as e:
             print(f"[Orchestrator] Error fatal procesando tarea: {e} | Data: {data}")
@@ -97,12 +134,21 @@ class DataOrchestrator:
     async def start(self):
 
         self._is_running = True
+        self.physical_lane.start()
         print("[Orchestrator] Iniciado. Esperando datos...")
         while self._is_running:
             try:
                 data = await self.processing_queue.get()
 
-                asyncio.create_task(self._route_and_process_task(data))
+                trace = getattr(data, "trace", None)
+                if trace is not None:
+                    trace.mark("processing_queue")
+
+                # Las constantes vitales van al carril por lotes; el resto, una tarea por registro.
+                if getattr(data, "type", None) == "physical":
+                    self.physical_lane.submit(data)
+                else:
+                    asyncio.create_task(self._route_and_process_task(data))
 
                 self.processing_queue.task_done()
 
@@ -114,7 +160,12 @@ class DataOrchestrator:
 
     async def shutdown(self):
 
+        # Se marca al final: si un primer apagado se cancela a medias, el
+        # siguiente lo repite entero.
+        if self._is_shut_down:
+            return
+        await self.physical_lane.close()
         print("[Orchestrator] Apagando pools de ejecutores...")
-        self.io_executor.shutdown(wait=True)
-        self.cpu_executor.shutdown(wait=True)
+        self.pools.shutdown()
+        self._is_shut_down = True
         print("[Orchestrator] Apagado completo.")
\ No newline at end of file
@@ -0,0 +1,87 @@
+import random
+import time
+from typing import Any, Dict, Optional
+
+from src import config
+from monitoring import MetricsCollector
+
+ADMIT = "admit"
+SHED = "shed"
+COALESCE = "coalesce"
+DEGRADE = "degrade"
+
+
+class OverloadController:
+
+    # Sale del modo degradado cuando la latencia baja de este % del SLO.
+    RECOVERY_RATIO = 0.8
+
+    def __init__(
+            self,
+            slo_ms: Optional[Dict[str, float]] = None,
+            alpha: Optional[float] = None,
+            sample_rates: Optional[Dict[str, float]] = None,
+            coalesce_sec: Optional[float] = None
+    ):
+
+        self.slo_ms = dict(slo_ms or config.SLO_LATENCY_MS)
+        self.alpha = alpha or config.OVERLOAD_EWMA_ALPHA
+        self.sample_rates = dict(sample_rates or config.DEGRADED_SAMPLE_RATES)
+        self.coalesce_sec = config.VITALS_COALESCE_SEC if coalesce_sec is None else coalesce_sec
+
+        self.latency_ewma: Dict[str, float] = {}
+        self.degraded: Dict[str, bool] = {data_type: False for data_type in self.slo_ms}
+        self._last_vitals: Dict[str, float] = {}
+        self.metrics = MetricsCollector()
+
+    def observe(self, data_type: str, latency_ms: float):
+
+        previous = self.latency_ewma.get(data_type)
+        ewma = latency_ms if previous is None else previous + self.alpha * (latency_ms - previous)
+        self.latency_ewma[data_type] = ewma
+
+        slo = self.slo_ms.get(data_type)
+        if slo is None:
+            return
+
+        was_degraded = self.degraded.get(data_type, False)
+        if not was_degraded and ewma > slo:
+            self.degraded[data_type] = True
+            print(f"[Overload] SLO de {data_type} superado ({ewma:.0f} ms > {slo:.0f} ms): modo degradado.")
+        elif was_degraded and ewma < slo * self.RECOVERY_RATIO:
+            self.degraded[data_type] = False
+            print(f"[Overload] {data_type} recuperado ({ewma:.0f} ms): modo normal.")
+
+        self.metrics.record_overload_state(data_type, ewma, slo, self.degraded[data_type])
+
+    def decide(self, record: Any) -> str:
+
+        data_type = record.type
+        decision = self._decide(record, data_type)
+        if decision != ADMIT:
+            self.metrics.record_overload_decision(data_type, decision)
+        return decision
+
+    def _decide(self, record: Any, data_type: str) -> str:
+
+        # Lo que ya disparó una alerta crítica nunca se descarta ni se degrada.
+        if getattr(record, "critical", False) or not self.degraded.get(data_type, False):
+            return ADMIT
+
+        if data_type == "genetic":
+            return DEGRADE
+
+        now = time.monotonic()
+        if data_type == "physical":
+            # Una sola lectura rutinaria por sujeto y ventana de agrupación.
+            last = self._last_vitals.get(record.subject_id)
+            if last is not None and (now - last) < self.coalesce_sec:
+                return COALESCE
+
+        if random.random() >= self.sample_rates.get(data_type, 1.0):
+            return SHED
+
+        if data_type == "physical":
+            self._last_vitals[record.subject_id] = now
+        return ADMIT
+
@@ -0,0 +1,189 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.runtime_config import runtime_config
+from . import io_tasks
+from .executors import ExecutorPools
+from .overload import ADMIT, OverloadController
+from communication.events import data_queue
+from monitoring import MetricsCollector, tracer
+
+CRITICAL_MESSAGE = "Evento crítico en constantes vitales"
+
+
+def critical_vitals_mask(heart_rate: np.ndarray, spo2: np.ndarray, limits: Any = None) -> np.ndarray:
+
+    # Las lecturas ausentes llegan como NaN: toda comparación da False.
+    limits = limits or runtime_config.settings
+    return (heart_rate > limits.heart_rate_max) | (heart_rate < limits.heart_rate_min) | \
+        (spo2 < limits.spo2_min)
+
+
+def _as_array(values: List[Optional[float]]) -> np.ndarray:
+    return np.array([np.nan if v is None else v for v in values], dtype=float)
+
+
+class PhysicalLane:
+
+    # Carril propio para las constantes vitales: acumula registros durante una
+    # ventana corta y procesa cada lote con una sola llamada de E/S.
+
+    def __init__(
+            self,
+            pools: ExecutorPools,
+            overload: OverloadController,
+            alert_manager: Any = None
+    ):
+
+        self.pools = pools
+        self.overload = overload
+        self.alert_manager = alert_manager
+        self.metrics = MetricsCollector()
+
+        self._pending: Deque[Tuple[float, Any]] = deque()
+        self._ready = asyncio.Event()
+        self._full = asyncio.Event()
+        self._inflight: Set[asyncio.Task] = set()
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, record: Any):
+
+        self._pending.append((time.perf_counter(), record))
+        self._ready.set()
+        if len(self._pending) >= runtime_config.settings.physical_batch_size:
+            self._full.set()
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+
+        while True:
+            batch = await self._next_batch()
+            # El lote se procesa aparte: mientras tanto se sigue acumulando el siguiente.
+            task = asyncio.create_task(self._flush(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _next_batch(self) -> List[Tuple[float, Any]]:
+
+        await self._ready.wait()
+        settings = runtime_config.settings
+        if len(self._pending) < settings.physical_batch_size:
+            self._full.clear()
+            try:
+                await asyncio.wait_for(self._full.wait(), settings.physical_batch_window_sec)
+            except asyncio.TimeoutError:
+                pass
+        return self._take(settings.physical_batch_size)
+
+    def _take(self, size: int) -> List[Tuple[float, Any]]:
+
+        batch = [self._pending.popleft() for _ in range(min(size, len(self._pending)))]
+        if not self._pending:
+            self._ready.clear()
+        return batch
+
+    async def _flush(self, batch: List[Tuple[float, Any]]):
+
+        try:
+            await self._process_batch(batch)
+        except Exception as e:
+            print(f"[Orchestrator] Error procesando lote físico ({len(batch)} registros): {e}")
+
+    async def _process_batch(self, batch: List[Tuple[float, Any]]):
+
+        flush_start = time.perf_counter()
+        records = [record for _, record in batch]
+        for record in records:
+            if record.trace is not None:
+                record.trace.mark("batch_wait")
+
+        # Comprobación crítica de todo el lote en una sola pasada vectorizada.
+        critical = critical_vitals_mask(
+            _as_array([r.heart_rate for r in records]),
+            _as_array([r.spo2 for r in records])
+        )
+        for i in np.flatnonzero(critical):
+            records[i].critical = True
+
+        alerts = None
+        if self.alert_manager is not None and critical.any():
+            # Una alerta por sujeto y lote: la primera lectura crítica de cada uno.
+            subject_ids = np.array([r.subject_id for r in records])
+            critical_idx = np.flatnonzero(critical)
+            _, first = np.unique(subject_ids[critical_idx], return_index=True)
+            alerts = asyncio.gather(*(
+                self.alert_manager.send_alert(level="CRITICAL", message=CRITICAL_MESSAGE, data=records[i])
+                for i in critical_idx[np.sort(first)]
+            ))
+
+        now = time.time()
+        admitted: List[Tuple[float, Any]] = []
+        for enqueued_at, record in batch:
+            if record.deadline and now > record.deadline:
+                self.metrics.record_deadline_event("physical", "expired_before_dispatch")
+                continue
+            if self.overload.decide(record) == ADMIT:
+                admitted.append((enqueued_at, record))
+
+        io_ms = 0.0
+        if admitted:
+            loop = asyncio.get_running_loop()
+            io_start = time.perf_counter()
+            await loop.run_in_executor(
+                self.pools.thread_executor,
+                io_tasks.save_vitals_batch_sync,
+                [record for _, record in admitted]
+            )
+            io_ms = (time.perf_counter() - io_start) * 1000
+
+        # Latencia por registro: desde que entra al carril hasta que está persistido.
+        done = time.perf_counter()
+        latencies_ms = [(done - enqueued_at) * 1000 for enqueued_at, _ in admitted]
+        wait_ms = (flush_start - batch[0][0]) * 1000
+        self.metrics.record_processing_batch("physical", latencies_ms)
+        self.metrics.record_batch("physical", len(batch), len(admitted), io_ms, wait_ms)
+
+        for _, record in admitted:
+            if record.trace is not None:
+                record.trace.mark("io_executor")
+                tracer.finish(record.trace)
+
+        if admitted:
+            mean_ms = sum(latencies_ms) / len(latencies_ms)
+            self.overload.observe("physical", mean_ms)
+            print(f"[Orchestrator] Lote físico: {len(admitted)}/{len(batch)} registros persistidos "
+                  f"en {io_ms:.2f} ms (latencia media {mean_ms:.2f} ms)")
+            await data_queue.put({"type": "latency", "label": "Physical", "value": mean_ms})
+
+            # Última lectura de cada sujeto en el lote.
+            latest = {record.subject_id: record for _, record in admitted}
+            for subject_id, record in latest.items():
+                await data_queue.put({
+                    "type": "vitals",
+                    "subject_id": subject_id,
+                    "heart_rate": record.heart_rate,
+                    "spo2": record.spo2,
+                    "critical": record.critical
+                })
+
+        if alerts is not None:
+            await alerts
+
+    async def close(self):
+
+        # Lo pendiente se vacía en un último lote antes de apagar los pools.
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        while self._pending:
+            await self._flush(self._take(runtime_config.settings.physical_batch_size))
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
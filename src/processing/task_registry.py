@@ -0,0 +1,78 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src import config
+from . import cpu_tasks
+
+# Backends de ejecución por tipo de análisis.
+PROCESS = "process"  # pool de procesos; la IPC viaja con el codec binario
+THREAD = "thread"    # pool de hilos, para código que libera el GIL (NumPy)
+INLINE = "inline"    # en el propio event loop, solo para trabajo trivial
+
+BACKENDS = (PROCESS, THREAD, INLINE)
+
+
+@dataclass(frozen=True)
+class TaskSpec:
+
+    data_type: str
+    func: Callable[[Any], Any]
+    packed_func: Optional[Callable[[bytes], bytes]] = None
+    degraded_func: Optional[Callable[[Any], Any]] = None
+    degraded_packed_func: Optional[Callable[[bytes], bytes]] = None
+    backend: str = PROCESS
+    label: str = ""
+
+    def resolve(self, degraded: bool = False) -> Tuple[Callable[[Any], Any], bool]:
+
+        # (función, empaquetada): el pool de procesos usa la variante bytes -> bytes.
+        if degraded and self.degraded_func is not None:
+            func, packed = self.degraded_func, self.degraded_packed_func
+        else:
+            func, packed = self.func, self.packed_func
+        if self.backend == PROCESS and packed is not None:
+            return packed, True
+        return func, False
+
+
+class TaskRegistry:
+
+    def __init__(self):
+        self._specs: Dict[str, TaskSpec] = {}
+
+    def register(self, spec: TaskSpec):
+
+        if spec.backend not in BACKENDS:
+            raise ValueError(f"Backend desconocido para {spec.data_type}: {spec.backend}")
+        self._specs[spec.data_type] = spec
+
+    def get(self, data_type: str) -> Optional[TaskSpec]:
+        return self._specs.get(data_type)
+
+    def types(self, backend: Optional[str] = None) -> List[str]:
+        return [t for t, spec in self._specs.items() if backend is None or spec.backend == backend]
+
+    def __contains__(self, data_type: str) -> bool:
+        return data_type in self._specs
+
+
+def default_registry() -> TaskRegistry:
+
+    registry = TaskRegistry()
+    registry.register(TaskSpec(
+        data_type="genetic",
+        func=cpu_tasks.analyze_genetic_sequence,
+        packed_func=cpu_tasks.analyze_genetic_packed,
+        degraded_func=cpu_tasks.screen_genetic_sequence,
+        degraded_packed_func=cpu_tasks.screen_genetic_packed,
+        backend=config.TASK_BACKENDS.get("genetic", PROCESS),
+        label="Genetic"
+    ))
+    registry.register(TaskSpec(
+        data_type="biochemical",
+        func=cpu_tasks.analyze_biochemical_model,
+        packed_func=cpu_tasks.analyze_biochemical_packed,
+        backend=config.TASK_BACKENDS.get("biochemical", PROCESS),
+        label="Biochemical"
+    ))
+    return registry
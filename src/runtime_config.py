@@ -0,0 +1,172 @@
+import asyncio
+import inspect
+import time
+from collections import deque
+from dataclasses import asdict, dataclass, field, fields
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src import config
+from monitoring import MetricsCollector
+
+
+@dataclass
+class RuntimeSettings:
+
+    # Recursos: al cambiar se redimensionan en caliente.
+    max_cpu_workers: int = config.MAX_CPU_WORKERS
+    max_io_workers: int = config.MAX_IO_WORKERS
+    input_queue_maxsize: int = config.INPUT_QUEUE_MAXSIZE
+    processing_queue_maxsize: int = config.PROCESSING_QUEUE_MAXSIZE
+    physical_batch_size: int = config.PHYSICAL_BATCH_SIZE
+
+    # Umbrales y tiempos: se leen en cada uso.
+    alert_cooldown_sec: float = config.ALERT_COOLDOWN_SEC
+    toxin_threshold: float = config.TOXIN_THRESHOLD
+    protein_x_min: float = config.PROTEIN_X_MIN
+    heart_rate_max: float = config.HEART_RATE_MAX
+    heart_rate_min: float = config.HEART_RATE_MIN
+    spo2_min: float = config.SPO2_MIN
+    trace_sample_rate: float = config.TRACE_SAMPLE_RATE
+    loop_block_threshold_ms: float = config.LOOP_BLOCK_THRESHOLD_MS
+    physical_batch_window_sec: float = config.PHYSICAL_BATCH_WINDOW_SEC
+    slo_latency_ms: Dict[str, float] = field(default_factory=lambda: dict(config.SLO_LATENCY_MS))
+    deadline_sec: Dict[str, float] = field(default_factory=lambda: dict(config.DEADLINE_SEC))
+
+
+_FIELD_TYPES: Dict[str, Any] = {f.name: f.type for f in fields(RuntimeSettings)}
+
+_BOUNDS: Dict[str, Tuple[float, float]] = {
+    "trace_sample_rate": (0.0, 1.0),
+    "physical_batch_window_sec": (0.0, 1.0),
+}
+
+
+def _validate(name: str, value: Any, current: Any) -> Any:
+
+    kind = _FIELD_TYPES.get(name)
+    if kind is None:
+        raise ValueError(f"Parámetro desconocido: {name}")
+
+    if kind is int:
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            raise ValueError(f"{name} debe ser un entero >= 1")
+        return value
+
+    if kind is float:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{name} debe ser numérico")
+        low, high = _BOUNDS.get(name, (0.0, float("inf")))
+        if not low <= value <= high:
+            raise ValueError(f"{name} fuera de rango [{low}, {high}]")
+        return float(value)
+
+    # Diccionarios por tipo de dato: se actualizan solo las claves indicadas.
+    if not isinstance(value, dict):
+        raise ValueError(f"{name} debe ser un objeto {{tipo: valor}}")
+    merged = dict(current)
+    for key, item in value.items():
+        if key not in current:
+            raise ValueError(f"{name}: tipo desconocido {key}")
+        if isinstance(item, bool) or not isinstance(item, (int, float)) or item <= 0:
+            raise ValueError(f"{name}.{key} debe ser un número > 0")
+        merged[key] = float(item)
+    return merged
+
+
+def _public(entry: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in entry.items() if not key.startswith("_")}
+
+
+class RuntimeConfig:
+
+    def __init__(self, settings: Optional[RuntimeSettings] = None):
+
+        self.settings = settings or RuntimeSettings()
+        self.history: deque = deque(maxlen=config.RUNTIME_HISTORY_SIZE)
+        self.metrics = MetricsCollector()
+
+        self._listeners: Dict[str, List[Callable[[Any], Any]]] = {}
+        self._samples: deque = deque(maxlen=3600)
+        self._lock: Optional[asyncio.Lock] = None
+
+    def subscribe(self, name: str, callback: Callable[[Any], Any]):
+
+        if name not in _FIELD_TYPES:
+            raise ValueError(f"Parámetro desconocido: {name}")
+        self._listeners.setdefault(name, []).append(callback)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "settings": asdict(self.settings),
+            "history": [_public(entry) for entry in self.history]
+        }
+
+    async def update(self, changes: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        # Un cambio a la vez: un redimensionado de pool puede tardar segundos.
+        async with self._lock:
+            validated = {
+                name: _validate(name, value, getattr(self.settings, name, None))
+                for name, value in changes.items()
+            }
+
+            before = self._rate(time.monotonic() - config.RUNTIME_EFFECT_WINDOW_SEC, time.monotonic())
+            applied: Dict[str, Dict[str, Any]] = {}
+            for name, value in validated.items():
+                old = getattr(self.settings, name)
+                if value == old:
+                    continue
+                setattr(self.settings, name, value)
+                try:
+                    for callback in self._listeners.get(name, ()):
+                        result = callback(value)
+                        if inspect.isawaitable(result):
+                            await result
+                except Exception:
+                    setattr(self.settings, name, old)
+                    raise
+                applied[name] = {"old": old, "new": value}
+                print(f"[Config] {name}: {old} -> {value}")
+
+            if not applied:
+                return None
+
+            entry = {
+                "at": time.time(),
+                "changes": applied,
+                "throughput_before_per_sec": before,
+                "throughput_after_per_sec": None,
+                "_applied_at": time.monotonic()
+            }
+            self.history.append(entry)
+            return _public(entry)
+
+    def _rate(self, start: float, end: float) -> Optional[float]:
+
+        window = [(t, n) for t, n in self._samples if start <= t <= end]
+        if len(window) < 2 or window[-1][0] <= window[0][0]:
+            return None
+        return (window[-1][1] - window[0][1]) / (window[-1][0] - window[0][0])
+
+    async def track_throughput(self, interval_sec: float = 1.0):
+
+        # Throughput = registros que terminan su procesamiento por segundo.
+        # Cada cambio se evalúa con la ventana anterior y la posterior.
+        window = config.RUNTIME_EFFECT_WINDOW_SEC
+        try:
+            while True:
+                now = time.monotonic()
+                self._samples.append((now, self.metrics.get_completed_count()))
+                for entry in self.history:
+                    applied_at = entry["_applied_at"]
+                    if entry["throughput_after_per_sec"] is None and now - applied_at >= window:
+                        entry["throughput_after_per_sec"] = self._rate(applied_at, applied_at + window)
+                await asyncio.sleep(interval_sec)
+        except asyncio.CancelledError:
+            pass
+
+
+runtime_config = RuntimeConfig()
@@ -4,10 +4,13 @@ from .base_service import BaseDataService
 from .genetico_service import GeneticoService
 from .bioquimico_service import BioquimicoService
 from .fisico_service import FisicoService
+from .vitals_aggregator import VitalsAggregator, vitals_aggregator
 
 __all__ = [
     "BaseDataService",
     "GeneticoService",
     "BioquimicoService",
-    "FisicoService"
+    "FisicoService",
+    "VitalsAggregator",
+    "vitals_aggregator"
 ]
\ No newline at end of file
@@ -1,11 +1,14 @@
 import asyncio
 from abc import ABC, abstractmethod
 from asyncio import Queue
-from typing import Any, Dict
+from typing import Any, Optional
+
+from src.runtime_config import runtime_config
 
 # Importaciones de otros módulos (asumimos que existen)
 from normalization.validators import DataNormalizer
 from alerting.alert_manager import AlertManager
+from ingestion.dedup import DeduplicationStage
 from monitoring import MetricsCollector
 
 class BaseDataService(ABC):
@@ -15,36 +18,74 @@ class BaseDataService(ABC):
             input_queue: Queue,
             processing_queue: Queue,
             normalizer: DataNormalizer,
-            alert_manager: AlertManager
+            alert_manager: AlertManager,
+            deduplicator: Optional[DeduplicationStage] = None
     ):
 
         self.input_queue = input_queue
         self.processing_queue = processing_queue
         self.normalizer = normalizer
         self.alert_manager = alert_manager
+        self.deduplicator = deduplicator
         self._is_running = False
         self.metrics = MetricsCollector()  # <--- AÑADE ESTA LÍNEA
 
     @abstractmethod
-    def _check_for_critical_events(self, data: Dict[str, Any]) -> bool:
+    def _check_for_critical_events(self, data: Any) -> bool:
 
         pass
 
+    def _check_for_trend_events(self, data: Any) -> Optional[str]:
+
+        return None
+
     async def _process_data(self, raw_data: Any):
+        trace = raw_data.pop("_trace", None) if isinstance(raw_data, dict) else None
         try:
+            # Reentregas del origen: se descartan antes de validar nada.
+            if self.deduplicator is not None and \
+                    self.deduplicator.is_duplicate(self.__class__.__name__, raw_data):
+                return
+
+            if trace is not None:
+                trace.mark("input_queue")
+
             normalized_data = self.normalizer.normalize(raw_data)
+            normalized_data.trace = trace
+
+            budget_sec = runtime_config.settings.deadline_sec.get(normalized_data.type)
+            if budget_sec:
+                normalized_data.deadline = normalized_data.ingested_at + budget_sec
+
+            if trace is not None:
+                trace.mark("normalization")
 
-            self.metrics.record_event(normalized_data.get("type", "unknown"))
+            self.metrics.record_event(normalized_data.type)
 
             if self._check_for_critical_events(normalized_data):
+                normalized_data.critical = True
                 await self.alert_manager.send_alert(
                     level="CRITICAL",
                     message=f"Evento crítico detectado en {self.__class__.__name__}",
                     data=normalized_data
                 )
 
+            trend_message = self._check_for_trend_events(normalized_data)
+            if trend_message:
+                await self.alert_manager.send_alert(
+                    level="WARNING",
+                    message=trend_message,
+                    data=normalized_data
+                )
+
+            if trace is not None:
+                trace.mark("alerting")
+
             await self.processing_queue.put(normalized_data)
 
+            if trace is not None:
+                trace.mark("processing_enqueue")
+
         except ValueError as e:
             print(f"Error de validación en {self.__class__.__name__}: {e}")
         except Exception as e:
@@ -1,22 +1,21 @@
 
-from typing import Any, Dict
+from src.runtime_config import runtime_config
+from communication.records import BiochemicalRecord
 from .base_service import BaseDataService
 
 
 class BioquimicoService(BaseDataService):
 
-    TOXIN_THRESHOLD = 80.0
-    PROTEIN_X_MIN = 5.0
+    def _check_for_critical_events(self, data: BiochemicalRecord) -> bool:
 
-    def _check_for_critical_events(self, data: Dict[str, Any]) -> bool:
+        limits = runtime_config.settings
+        toxin_level = data.toxin_level
+        protein_x = data.protein_x_level
 
-        toxin_level = data.get("toxin_level", 0.0)
-        protein_x = data.get("protein_x_level", 10.0)
-
-        if toxin_level > self.TOXIN_THRESHOLD:
+        if toxin_level > limits.toxin_threshold:
             return True
 
-        if protein_x < self.PROTEIN_X_MIN:
+        if protein_x < limits.protein_x_min:
             return True
 
         return False
\ No newline at end of file
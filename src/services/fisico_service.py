@@ -1,27 +1,33 @@
+from typing import Optional
 
-from typing import Any, Dict
+from src import config
+from communication.records import PhysicalRecord
 from .base_service import BaseDataService
+from .vitals_aggregator import vitals_aggregator
 
 
 class FisicoService(BaseDataService):
 
-    MAX_HEART_RATE = 190
-    MIN_HEART_RATE = 40
-    MIN_SPO2 = 90
+    def __init__(self, *args, aggregator=None, **kwargs):
 
-    def _check_for_critical_events(self, data: Dict[str, Any]) -> bool:
+        super().__init__(*args, **kwargs)
+        self.aggregator = aggregator or vitals_aggregator
 
-        heart_rate = data.get("heart_rate")
-        spo2 = data.get("spo2")
+    def _check_for_critical_events(self, data: PhysicalRecord) -> bool:
 
-        if heart_rate is not None:
-            if heart_rate > self.MAX_HEART_RATE or heart_rate < self.MIN_HEART_RATE:
-                return True
+        # Los umbrales se evalúan por lotes en el carril físico del orquestador.
+        return False
 
-        if spo2 is not None and spo2 < self.MIN_SPO2:
-            return True
+    def _check_for_trend_events(self, data: PhysicalRecord) -> Optional[str]:
 
-        if heart_rate == 0:
-            return True
+        self.aggregator.update(data)
 
-        return False
\ No newline at end of file
+        window = self.aggregator.get_window(data.subject_id, "spo2", config.SPO2_TREND_WINDOW)
+        if window is None or window.count < config.SPO2_TREND_MIN_SAMPLES:
+            return None
+
+        if window.slope < config.SPO2_DECLINE_SLOPE:
+            # Mensaje fijo: AlertManager aplica el cooldown por (mensaje, sujeto).
+            return "Descenso sostenido de SpO2"
+
+        return None
@@ -1,5 +1,5 @@
 
-from typing import Any, Dict
+from communication.records import GeneticRecord
 from .base_service import BaseDataService
 
 
@@ -8,14 +8,9 @@ class GeneticoService(BaseDataService):
 
     CRITICAL_MUTATIONS = {"T-VIRUS", "G-VIRUS"}
 
-    def _check_for_critical_events(self, data: Dict[str, Any]) -> bool:
+    def _check_for_critical_events(self, data: GeneticRecord) -> bool:
 
-        detected_mutations = data.get("detected_mutations", set())
-
-        if not isinstance(detected_mutations, set):
-            detected_mutations = set(detected_mutations)
-
-        if self.CRITICAL_MUTATIONS.intersection(detected_mutations):
+        if self.CRITICAL_MUTATIONS.intersection(data.detected_mutations):
             return True
 
         return False
\ No newline at end of file
@@ -0,0 +1,185 @@
+import time
+from array import array
+from collections import deque
+from typing import Any, Dict, Optional
+
+from src import config
+from communication.records import PhysicalRecord
+
+
+class RollingWindow:
+
+    def __init__(self, capacity: int):
+
+        self.capacity = capacity
+        self._values = array("d", bytes(8 * capacity))
+        self._times = array("d", bytes(8 * capacity))
+        self._seq = 0
+        self.count = 0
+
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._sum_t = 0.0
+        self._sum_tt = 0.0
+        self._sum_tv = 0.0
+
+        # Colas monótonas (secuencia, valor): min/max en O(1) amortizado.
+        self._min_q: deque = deque()
+        self._max_q: deque = deque()
+
+    def push(self, t: float, value: float):
+
+        slot = self._seq % self.capacity
+
+        if self.count == self.capacity:
+            old_v = self._values[slot]
+            old_t = self._times[slot]
+            self._sum -= old_v
+            self._sum_sq -= old_v * old_v
+            self._sum_t -= old_t
+            self._sum_tt -= old_t * old_t
+            self._sum_tv -= old_t * old_v
+        else:
+            self.count += 1
+
+        self._values[slot] = value
+        self._times[slot] = t
+        self._sum += value
+        self._sum_sq += value * value
+        self._sum_t += t
+        self._sum_tt += t * t
+        self._sum_tv += t * value
+
+        oldest_seq = self._seq - self.capacity + 1
+        while self._min_q and self._min_q[-1][1] >= value:
+            self._min_q.pop()
+        self._min_q.append((self._seq, value))
+        while self._min_q[0][0] < oldest_seq:
+            self._min_q.popleft()
+
+        while self._max_q and self._max_q[-1][1] <= value:
+            self._max_q.pop()
+        self._max_q.append((self._seq, value))
+        while self._max_q[0][0] < oldest_seq:
+            self._max_q.popleft()
+
+        self._seq += 1
+
+    @property
+    def last(self) -> Optional[float]:
+        if self.count == 0:
+            return None
+        return self._values[(self._seq - 1) % self.capacity]
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        if self.count < 2:
+            return 0.0
+        mean = self.mean
+        return max(self._sum_sq / self.count - mean * mean, 0.0)
+
+    @property
+    def minimum(self) -> Optional[float]:
+        return self._min_q[0][1] if self._min_q else None
+
+    @property
+    def maximum(self) -> Optional[float]:
+        return self._max_q[0][1] if self._max_q else None
+
+    @property
+    def slope(self) -> float:
+        # Pendiente de mínimos cuadrados (unidades por segundo).
+        n = self.count
+        if n < 2:
+            return 0.0
+        denominator = n * self._sum_tt - self._sum_t * self._sum_t
+        if denominator <= 1e-12:
+            return 0.0
+        return (n * self._sum_tv - self._sum_t * self._sum) / denominator
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "last": self.last,
+            "mean": self.mean,
+            "variance": self.variance,
+            "min": self.minimum,
+            "max": self.maximum,
+            "slope_per_sec": self.slope
+        }
+
+
+class SubjectVitals:
+
+    METRICS = ("heart_rate", "spo2")
+
+    def __init__(self, windows: Dict[str, int]):
+
+        # Los tiempos se guardan relativos al primer registro para no perder
+        # precisión en las sumas de t y t².
+        self.origin = time.monotonic()
+        self.updated_at: Optional[float] = None
+        self.windows: Dict[str, Dict[str, RollingWindow]] = {
+            metric: {name: RollingWindow(size) for name, size in windows.items()}
+            for metric in self.METRICS
+        }
+
+    def update(self, data: PhysicalRecord, now: float):
+
+        t = now - self.origin
+        for metric in self.METRICS:
+            value = getattr(data, metric)
+            if value is None:
+                continue
+            for window in self.windows[metric].values():
+                window.push(t, float(value))
+        self.updated_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "updated_at": self.updated_at,
+            **{
+                metric: {name: window.snapshot() for name, window in windows.items()}
+                for metric, windows in self.windows.items()
+            }
+        }
+
+
+class VitalsAggregator:
+
+    def __init__(self, windows: Optional[Dict[str, int]] = None):
+
+        self.window_sizes = dict(windows or config.VITALS_WINDOWS)
+        self.subjects: Dict[str, SubjectVitals] = {}
+
+    def update(self, data: PhysicalRecord) -> SubjectVitals:
+
+        subject_id = data.subject_id
+        vitals = self.subjects.get(subject_id)
+        if vitals is None:
+            vitals = SubjectVitals(self.window_sizes)
+            self.subjects[subject_id] = vitals
+
+        vitals.update(data, time.monotonic())
+        return vitals
+
+    def get_window(self, subject_id: str, metric: str, window: str) -> Optional[RollingWindow]:
+
+        vitals = self.subjects.get(subject_id)
+        if vitals is None:
+            return None
+        return vitals.windows.get(metric, {}).get(window)
+
+    def get_snapshot(self, subject_id: str) -> Optional[Dict[str, Any]]:
+
+        vitals = self.subjects.get(subject_id)
+        if vitals is None:
+            return None
+        return {"subject_id": subject_id, **vitals.snapshot()}
+
+
+vitals_aggregator = VitalsAggregator()
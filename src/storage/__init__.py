@@ -0,0 +1,12 @@
+"""
+Módulo de Almacenamiento
+
+Persistencia append-only de resultados y constantes vitales
+codificados con el codec binario de `communication.codec`.
+"""
+
+from .record_store import RecordStore
+
+__all__ = [
+    "RecordStore"
+]
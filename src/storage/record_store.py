@@ -0,0 +1,66 @@
+import os
+import struct
+import threading
+from typing import Any, Iterator, List, Tuple
+
+from communication import codec
+
+# Fichero append-only de tramas [longitud u32][payload del codec].
+_FRAME_HEADER = struct.Struct("<I")
+
+
+class RecordStore:
+
+    def __init__(self, path: str):
+
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+    def append(self, records: List[Any]) -> int:
+
+        buf = bytearray()
+        for record in records:
+            payload = codec.encode(record)
+            buf += _FRAME_HEADER.pack(len(payload))
+            buf += payload
+
+        with self._lock:
+            with open(self.path, "ab") as f:
+                f.write(buf)
+        return len(buf)
+
+    def iter_chunks(self, chunk_size: int = 10_000, start_offset: int = 0) -> Iterator[Tuple[List[Any], int]]:
+
+        # Devuelve (registros, offset tras el último registro completo); el offset
+        # sirve como marca de agua para reanudar la lectura más adelante.
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(start_offset)
+            offset = start_offset
+            chunk: List[Any] = []
+
+            while True:
+                header = f.read(_FRAME_HEADER.size)
+                if len(header) < _FRAME_HEADER.size:
+                    break
+                (length,) = _FRAME_HEADER.unpack(header)
+                payload = f.read(length)
+                if len(payload) < length:
+                    # Trama a medio escribir: se relee en la siguiente pasada.
+                    break
+
+                chunk.append(codec.decode(payload))
+                offset += _FRAME_HEADER.size + length
+
+                if len(chunk) >= chunk_size:
+                    yield chunk, offset
+                    chunk = []
+
+            if chunk:
+                yield chunk, offset
+
+    def size_bytes(self) -> int:
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
@@ -1,6 +1,12 @@
-
-from .app import run_web_server
+# FastAPI y uvicorn solo se cargan si se arranca el servidor web.
 
 __all__ = [
     "run_web_server"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    if name == "run_web_server":
+        from .app import run_web_server
+        return run_web_server
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,15 @@
 
 import asyncio
-from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from fastapi import Body, FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pathlib import Path
+from typing import Any, Dict
 
-from monitoring import MetricsCollector
+from src.runtime_config import runtime_config
+from monitoring import MetricsCollector, tracer
+from services.vitals_aggregator import vitals_aggregator
 from .connection_manager import manager, websocket_broadcaster
 
 
@@ -40,12 +43,41 @@ async def get_metrics():
     return stats
 
 
+@app.get("/api/trace")
+async def get_trace():
+    # Abrir en chrome://tracing o ui.perfetto.dev.
+    return tracer.export_chrome_trace()
+
+
+@app.get("/api/subjects/{subject_id}/vitals")
+async def get_subject_vitals(subject_id: str):
+    snapshot = vitals_aggregator.get_snapshot(subject_id)
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail=f"Sujeto desconocido: {subject_id}")
+    return snapshot
+
+
+@app.get("/api/admin/config")
+async def get_runtime_config():
+    return runtime_config.snapshot()
+
+
+@app.patch("/api/admin/config")
+async def patch_runtime_config(changes: Dict[str, Any] = Body(...)):
+    try:
+        applied = await runtime_config.update(changes)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"applied": applied, "settings": runtime_config.snapshot()["settings"]}
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
         while True:
-            await websocket.receive_text()
+            text = await websocket.receive_text()
+            await websocket.send_json(manager.handle_client_message(websocket, text))
     except WebSocketDisconnect:
         manager.disconnect(websocket)
     except Exception:
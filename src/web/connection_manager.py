@@ -1,33 +1,174 @@
 
 import asyncio
 import json
-from typing import List
+import time
+from typing import Any, Dict, Iterable, List, Optional, Set
 from fastapi import WebSocket
 
+from communication.events import data_queue
+from monitoring import MetricsCollector
+
+
+# Temas: "alerts/<NIVEL>", "latency/<tipo>", "vitals/<sujeto>". Un patrón
+# "prefijo/*" cubre todo lo que cuelga de ese prefijo y "*" cubre todo.
+DEFAULT_TOPICS = ("alerts/*", "latency/*")
+
+
+def topic_for(data: Dict[str, Any]) -> str:
+
+    kind = data.get("type")
+    if kind == "alert":
+        return f"alerts/{data.get('level', 'INFO')}"
+    if kind == "latency":
+        return f"latency/{str(data.get('label', 'unknown')).lower()}"
+    if kind == "vitals":
+        return f"vitals/{data.get('subject_id')}"
+    return str(kind)
+
+
+def _patterns_matching(topic: str) -> List[str]:
+    parts = topic.split("/")
+    return [topic, "*"] + ["/".join(parts[:i]) + "/*" for i in range(1, len(parts))]
+
+
+class Subscription:
+
+    __slots__ = ("patterns", "max_rate", "_tokens", "_last")
+
+    def __init__(self):
+        self.patterns: Set[str] = set()
+        self.max_rate: Optional[float] = None
+        self._tokens = 0.0
+        self._last = time.monotonic()
+
+    def allow(self) -> bool:
+
+        # Token bucket con ráfaga de un segundo.
+        if not self.max_rate:
+            return True
+        now = time.monotonic()
+        self._tokens = min(self.max_rate, self._tokens + (now - self._last) * self.max_rate)
+        self._last = now
+        if self._tokens < 1.0:
+            return False
+        self._tokens -= 1.0
+        return True
+
 
 class ConnectionManager:
     def __init__(self):
         self.active_connections: List[WebSocket] = []
+        self.subscriptions: Dict[WebSocket, Subscription] = {}
+        # Índice patrón -> conexiones: cada mensaje solo visita a los interesados.
+        self._index: Dict[str, Set[WebSocket]] = {}
+        self.metrics = MetricsCollector()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
         self.active_connections.append(websocket)
+        self.subscriptions[websocket] = Subscription()
+        # Sin mensaje de suscripción el cliente recibe lo mismo que antes.
+        self.subscribe(websocket, DEFAULT_TOPICS)
+        self.metrics.set_ws_connections(len(self.active_connections))
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
+        subscription = self.subscriptions.pop(websocket, None)
+        if subscription is not None:
+            self._unindex(websocket, subscription.patterns)
+        self.metrics.set_ws_connections(len(self.active_connections))
+
+    def subscribe(self, websocket: WebSocket, topics: Iterable[str], max_rate: Optional[float] = None):
+        subscription = self.subscriptions[websocket]
+        for topic in topics:
+            subscription.patterns.add(topic)
+            self._index.setdefault(topic, set()).add(websocket)
+        if max_rate is not None:
+            subscription.max_rate = max_rate or None
+            subscription._tokens = subscription.max_rate or 0.0
+
+    def unsubscribe(self, websocket: WebSocket, topics: Iterable[str]):
+        subscription = self.subscriptions[websocket]
+        topics = set(topics) & subscription.patterns
+        subscription.patterns -= topics
+        self._unindex(websocket, topics)
+
+    def _unindex(self, websocket: WebSocket, topics: Iterable[str]):
+        for topic in topics:
+            subscribers = self._index.get(topic)
+            if subscribers is not None:
+                subscribers.discard(websocket)
+                if not subscribers:
+                    del self._index[topic]
+
+    def handle_client_message(self, websocket: WebSocket, text: str) -> Dict[str, Any]:
+
+        # {"action": "subscribe" | "unsubscribe" | "set", "topics": [...], "max_rate": 5}
+        try:
+            request = json.loads(text)
+            action = request.get("action")
+            topics = request.get("topics", [])
+            max_rate = request.get("max_rate")
+            if not isinstance(topics, list) or not all(isinstance(t, str) for t in topics):
+                raise ValueError("topics debe ser una lista de cadenas")
+            if max_rate is not None and (isinstance(max_rate, bool) or not isinstance(max_rate, (int, float))
+                                         or max_rate < 0):
+                raise ValueError("max_rate debe ser un número >= 0")
+        except (ValueError, AttributeError) as e:
+            return {"type": "error", "message": f"Mensaje inválido: {e}"}
+
+        if action == "subscribe":
+            self.subscribe(websocket, topics, max_rate)
+        elif action == "unsubscribe":
+            self.unsubscribe(websocket, topics)
+        elif action == "set":
+            self.unsubscribe(websocket, list(self.subscriptions[websocket].patterns))
+            self.subscribe(websocket, topics, max_rate if max_rate is not None else 0)
+        else:
+            return {"type": "error", "message": f"Acción desconocida: {action}"}
+
+        subscription = self.subscriptions[websocket]
+        return {
+            "type": "subscriptions",
+            "topics": sorted(subscription.patterns),
+            "max_rate": subscription.max_rate
+        }
+
+    def subscribers_for(self, topic: str) -> Set[WebSocket]:
+        targets: Set[WebSocket] = set()
+        for pattern in _patterns_matching(topic):
+            subscribers = self._index.get(pattern)
+            if subscribers:
+                targets |= subscribers
+        return targets
+
+    async def _send(self, connection: WebSocket, message: str) -> bool:
+        try:
+            await connection.send_text(message)
+            return True
+        except Exception:
+            self.disconnect(connection)
+            return False
 
     async def broadcast(self, data: dict):
+        topic = topic_for(data)
+        targets = self.subscribers_for(topic)
+        if not targets:
+            self.metrics.record_ws_publish(topic, 0, 0, 0)
+            return
+
+        allowed = [c for c in targets if self.subscriptions[c].allow()]
+        rate_limited = len(targets) - len(allowed)
+
+        # Se serializa una sola vez por mensaje, sea cual sea el nº de destinatarios.
         message = json.dumps(data)
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except Exception:
-                pass
+        results = await asyncio.gather(*(self._send(c, message) for c in allowed))
+        sent = sum(results)
+        self.metrics.record_ws_publish(topic, sent, sent * len(message.encode("utf-8")), rate_limited)
 
 manager = ConnectionManager()
 
-data_queue = asyncio.Queue()
-
 
 async def websocket_broadcaster():
     print("[WebSocket] Broadcaster iniciado. Esperando eventos...")
@@ -42,4 +183,4 @@ async def websocket_broadcaster():
             print("[WebSocket] Broadcaster detenido.")
             break
         except Exception as e:
-            print(f"[WebSocket] Error en broadcaster: {e}")
\ No newline at end of file
+            print(f"[WebSocket] Error en broadcaster: {e}")
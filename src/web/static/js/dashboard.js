@@ -5,6 +5,11 @@ document.addEventListener("DOMContentLoaded", () => {
     const metricTotalErrors = document.getElementById("metric-total-errors");
     const metricAlertLatency = document.getElementById("metric-alert-latency");
     const alertList = document.getElementById("alert-list");
+    const queueTableBody = document.querySelector("#queue-table tbody");
+    const loopLag = document.getElementById("loop-lag");
+    const loopMaxLag = document.getElementById("loop-max-lag");
+    const loopBlocked = document.getElementById("loop-blocked");
+    const loopLastBlock = document.getElementById("loop-last-block");
 
     const MAX_DATA_POINTS = 50;
 
@@ -107,12 +112,15 @@ document.addEventListener("DOMContentLoaded", () => {
 
     function connectWebSocket() {
         const wsProtocol = window.location.protocol === "https:" ? "wss:" : "ws:";
-        const wsUrl = `${wsProtocol};
+        const wsUrl = `${wsProtocol}//${window.location.host}/ws`;
 
         console.log("Conectando a WebSocket en:", wsUrl);
         const ws = new WebSocket(wsUrl);
 
-        ws.onopen = () => console.log("WebSocket conectado.");
+        ws.onopen = () => {
+            console.log("WebSocket conectado.");
+            ws.send(JSON.stringify({ action: "set", topics: ["alerts/*", "latency/*"] }));
+        };
         ws.onclose = () => {
             console.log("WebSocket desconectado. Intentando reconectar en 3s...");
             setTimeout(connectWebSocket, 3000);
@@ -130,6 +138,9 @@ document.addEventListener("DOMContentLoaded", () => {
                     case "alert":
                         addAlertToList(data.message, data.level);
                         break;
+                    case "error":
+                        console.error("Suscripción rechazada:", data.message);
+                        break;
                 }
             } catch (e) {
                 console.error("Error procesando mensaje de WS:", e);
@@ -138,6 +149,32 @@ document.addEventListener("DOMContentLoaded", () => {
     }
 
 
+    function updateQueuePanel(queues, eventLoop) {
+        queueTableBody.innerHTML = "";
+        Object.entries(queues).forEach(([name, stats]) => {
+            const row = document.createElement("tr");
+            [name, stats.depth, stats.high_water, stats.maxsize || "∞"].forEach(value => {
+                const cell = document.createElement("td");
+                cell.textContent = value;
+                row.appendChild(cell);
+            });
+            if (stats.maxsize && stats.depth >= stats.maxsize * 0.8) {
+                row.className = "queue-near-full";
+            }
+            queueTableBody.appendChild(row);
+        });
+
+        loopLag.textContent = eventLoop.lag_ms.toFixed(2);
+        loopMaxLag.textContent = eventLoop.max_lag_ms.toFixed(2);
+        loopBlocked.textContent = eventLoop.blocked_count;
+
+        const lastBlock = eventLoop.recent_blocks[eventLoop.recent_blocks.length - 1];
+        loopLastBlock.textContent = lastBlock
+            ? `Último bloqueo (${lastBlock.duration_ms.toFixed(0)} ms):\n${lastBlock.stack.slice(-4).join("")}`
+            : "";
+    }
+
+
     async function updateAggregateMetrics() {
         try {
             const response = await fetch('/api/metrics');
@@ -147,6 +184,7 @@ document.addEventListener("DOMContentLoaded", () => {
             metricTotalProcessed.textContent = stats.events_processed.total;
             metricTotalErrors.textContent = stats.errors_count.total;
             metricAlertLatency.textContent = stats.average_alert_latency_ms.toFixed(2);
+            updateQueuePanel(stats.queues, stats.event_loop);
 
         } catch (error) {
             console.error("Error en updateAggregateMetrics:", error);
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Mismo layout de importación que run.py: raíz del repo + src/.
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "src"))
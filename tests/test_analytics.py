@@ -0,0 +1,88 @@
+import pandas as pd
+import pytest
+
+from analytics import IncrementalAnalytics, percentile_from_histogram, write_html_report
+from communication.records import AnalysisResult, PhysicalRecord
+from storage import RecordStore
+
+
+def _results(n, offset=0):
+    out = []
+    for i in range(offset, offset + n):
+        if i % 2:
+            out.append(AnalysisResult(f"res_bio_{i}", "biochemical", f"bio_{i}", "Niveles de toxina inestables",
+                                      toxin_level=float(10 + i % 90), latency_ms=1500.0 + i))
+        else:
+            out.append(AnalysisResult(f"res_gen_{i}", "genetic", f"gen_{i}",
+                                      "Mutación T-Virus detectada" if i % 4 == 0 else "Estable",
+                                      source_lab="Lab-01", latency_ms=2000.0 + i))
+    return out
+
+
+def _vitals(n, offset=0):
+    return [PhysicalRecord(f"subject_{i % 3}", 0 if i % 7 == 0 else 70, 97) for i in range(offset, offset + n)]
+
+
+@pytest.fixture
+def stores(tmp_path):
+    return RecordStore(str(tmp_path / "results.bin")), RecordStore(str(tmp_path / "vitals.bin")), tmp_path
+
+
+def _analytics(stores):
+    results, vitals, tmp_path = stores
+    return IncrementalAnalytics(results, vitals, str(tmp_path / "state.json"))
+
+
+def test_incremental_update_matches_full_rescan(stores, tmp_path):
+    results, vitals, _ = stores
+    results.append(_results(50))
+    vitals.append(_vitals(30))
+
+    incremental = _analytics(stores)
+    assert incremental.update(chunk_size=7) == {"results": 50, "vitals": 30}
+    incremental.save()
+
+    results.append(_results(40, offset=50))
+    vitals.append(_vitals(20, offset=30))
+    resumed = _analytics(stores)
+    assert resumed.update() == {"results": 40, "vitals": 20}
+
+    full = IncrementalAnalytics(results, vitals, str(tmp_path / "other.json"))
+    full.update()
+
+    pd.testing.assert_frame_equal(resumed.by_lab(), full.by_lab())
+    pd.testing.assert_frame_equal(resumed.by_subject(), full.by_subject())
+
+
+def test_aggregates(stores):
+    results, vitals, _ = stores
+    results.append(_results(100))
+    vitals.append(_vitals(21))
+    analytics = _analytics(stores)
+    analytics.update()
+
+    by_type = analytics.by_type()
+    assert by_type.loc["genetic", "count"] == 50
+    assert by_type.loc["genetic", "alert_rate"] == pytest.approx(0.5)
+    assert 2000 <= by_type.loc["genetic", "latency_p50_ms"] <= 3000
+    assert sum(by_type.loc["biochemical", "toxin_hist"]) == 50
+
+    by_subject = analytics.by_subject()
+    assert by_subject["count"].sum() == 21
+    assert by_subject["critical"].sum() == 3
+
+
+def test_percentile_from_histogram():
+    edges = [10, 20, 30]
+    assert percentile_from_histogram([0, 10, 0, 0], edges, 0.5) == pytest.approx(15.0)
+    assert percentile_from_histogram([0, 0, 0, 0], edges, 0.5) is None
+
+
+def test_report_is_written_without_chart_libraries(stores, tmp_path):
+    results, vitals, _ = stores
+    results.append(_results(10))
+    analytics = _analytics(stores)
+    analytics.update()
+    path = write_html_report(analytics, str(tmp_path / "report.html"))
+    content = open(path, encoding="utf-8").read()
+    assert "Por tipo de análisis" in content and "biochemical" in content
@@ -0,0 +1,75 @@
+import pickle
+
+import pytest
+
+from communication import codec
+from communication.records import AnalysisResult, BiochemicalRecord, GeneticRecord, PhysicalRecord
+from storage import RecordStore
+
+
+RECORDS = [
+    GeneticRecord("0f6c7a1e-1b7e-4f55-9d0c-3f0c2b1d9a11", "ATCGATCGATCGT", ("G-VIRUS", "T-VIRUS"), "Lab-01"),
+    GeneticRecord("s-2", "", (), None),
+    GeneticRecord("s-3", "ATCGNNAX", ("T-VIRUS",), "Lab-Ñ"),
+    BiochemicalRecord("bio_1234", 42.5, 7.25),
+    PhysicalRecord("subject_3", 72, 97),
+    PhysicalRecord("subject_4", None, None),
+    PhysicalRecord("subject_5", 0, 85),
+    PhysicalRecord("subject_6", 80, 96, ingested_at=1792420628.25, deadline=1792420633.25),
+    BiochemicalRecord("bio_9", 81.0, 4.5, ingested_at=1792420628.5, deadline=1792420636.5),
+    AnalysisResult("res_bio_1", "biochemical", "bio_1", "Niveles de toxina inestables", None, 88.1, 1503.2),
+    AnalysisResult("res_s-1", "genetic", "s-1", "Estable", "Lab-07", None, 0.0),
+]
+
+
+@pytest.mark.parametrize("record", RECORDS)
+def test_round_trip(record):
+    assert codec.decode(codec.encode(record)) == record
+
+
+@pytest.mark.parametrize("length", range(0, 17))
+def test_sequence_packing_all_lengths(length):
+    sequence = ("ACGT" * 5)[:length]
+    packed = codec.pack_sequence(sequence)
+    assert len(packed) == (length + 3) // 4
+    assert codec.unpack_sequence(packed, length) == sequence
+
+
+def test_encoded_smaller_than_pickle():
+    for record in RECORDS[:2] + RECORDS[3:]:
+        assert len(codec.encode(record)) < len(pickle.dumps(record, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def test_rejects_unknown_version_and_garbage():
+    payload = bytearray(codec.encode(RECORDS[0]))
+    payload[0] = codec.CODEC_VERSION + 1
+    with pytest.raises(codec.CodecError):
+        codec.decode(bytes(payload))
+    with pytest.raises(codec.CodecError):
+        codec.decode(codec.encode(RECORDS[0])[:-3])
+    with pytest.raises(codec.CodecError):
+        codec.encode({"sample_id": "x"})
+
+
+def test_decodes_v1_payloads_without_timing():
+    record = PhysicalRecord("subject_6", 80, 96, ingested_at=1.0, deadline=2.0)
+    v1_payload = bytes([1]) + codec.encode(record)[1:-16]
+    assert codec.decode(v1_payload) == PhysicalRecord("subject_6", 80, 96)
+
+
+def test_record_store_chunks_and_watermark(tmp_path):
+    store = RecordStore(str(tmp_path / "results.bin"))
+    store.append(RECORDS[:4])
+    store.append(RECORDS[4:])
+
+    chunks = list(store.iter_chunks(chunk_size=4))
+    assert [len(records) for records, _ in chunks] == [4, 4, 3]
+    assert [r for records, _ in chunks for r in records] == RECORDS
+
+    watermark = chunks[-1][1]
+    assert watermark == store.size_bytes()
+    assert list(store.iter_chunks(start_offset=watermark)) == []
+
+    store.append([RECORDS[0]])
+    (records, _), = store.iter_chunks(start_offset=watermark)
+    assert records == [RECORDS[0]]
@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+from web.connection_manager import ConnectionManager, topic_for
+
+
+class FakeWebSocket:
+
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, message):
+        self.sent.append(json.loads(message))
+
+
+def _connect(manager, *messages):
+    websocket = FakeWebSocket()
+    asyncio.run(manager.connect(websocket))
+    for message in messages:
+        reply = manager.handle_client_message(websocket, json.dumps(message))
+        assert reply["type"] == "subscriptions"
+    return websocket
+
+
+ALERT = {"type": "alert", "level": "CRITICAL", "message": "x"}
+LATENCY = {"type": "latency", "label": "Genetic", "value": 1.0}
+VITALS = {"type": "vitals", "subject_id": "subject_3", "heart_rate": 70, "spo2": 97}
+
+
+def test_topics_derived_from_messages():
+    assert topic_for(ALERT) == "alerts/CRITICAL"
+    assert topic_for(LATENCY) == "latency/genetic"
+    assert topic_for(VITALS) == "vitals/subject_3"
+
+
+def test_only_interested_connections_receive_messages():
+    manager = ConnectionManager()
+    legacy = _connect(manager)
+    wall = _connect(manager, {"action": "set", "topics": ["alerts/CRITICAL"]})
+    subject = _connect(manager, {"action": "set", "topics": ["vitals/subject_3"]})
+
+    for message in (ALERT, LATENCY, VITALS, {**VITALS, "subject_id": "subject_4"}):
+        asyncio.run(manager.broadcast(message))
+
+    assert [m["type"] for m in legacy.sent] == ["alert", "latency"]
+    assert wall.sent == [ALERT]
+    assert subject.sent == [VITALS]
+
+
+def test_rate_cap_drops_excess_messages():
+    manager = ConnectionManager()
+    capped = _connect(manager, {"action": "set", "topics": ["latency/*"], "max_rate": 2})
+
+    async def burst():
+        for _ in range(10):
+            await manager.broadcast(LATENCY)
+
+    asyncio.run(burst())
+    assert len(capped.sent) == 2
+
+
+def test_invalid_requests_are_rejected_and_disconnect_cleans_index():
+    manager = ConnectionManager()
+    websocket = _connect(manager)
+    assert manager.handle_client_message(websocket, "no json")["type"] == "error"
+    assert manager.handle_client_message(websocket, json.dumps({"action": "dance"}))["type"] == "error"
+
+    manager.disconnect(websocket)
+    assert not manager.subscribers_for("alerts/CRITICAL")
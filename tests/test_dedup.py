@@ -0,0 +1,54 @@
+from ingestion.dedup import BloomFilter, DeduplicationStage, RotatingBloomFilter
+
+
+def _bio(sample_id="bio_1234", toxin="42.00 ppm", ingested_at=1.0):
+    return {"sample_id": sample_id, "toxin_level": toxin, "protein_x": 3.5, "ingested_at": ingested_at}
+
+
+def test_bloom_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    keys = [f"k{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+    assert all(key in bloom for key in keys)
+
+
+def test_bloom_false_positive_rate_near_target():
+    bloom = BloomFilter(5000, 0.01)
+    for i in range(5000):
+        bloom.add(f"in-{i}")
+    false_positives = sum(f"out-{i}" in bloom for i in range(20000))
+    assert false_positives / 20000 < 0.02
+
+
+def test_rotation_forgets_old_generations():
+    rotating = RotatingBloomFilter(window_sec=10, capacity=100, fp_rate=0.01, generations=2)
+    now = rotating._rotated_at
+    assert not rotating.check_and_add("a", now)
+    assert rotating.check_and_add("a", now + 6)
+    assert not rotating.check_and_add("a", now + 12)
+
+
+def test_redelivery_is_suppressed_despite_new_ingestion_stamp():
+    stage = DeduplicationStage(exact_confirm=False)
+    assert not stage.is_duplicate("BioquimicoService", _bio(ingested_at=1.0))
+    assert stage.is_duplicate("BioquimicoService", _bio(ingested_at=9.0))
+
+
+def test_reused_sample_id_with_other_content_passes():
+    stage = DeduplicationStage()
+    assert not stage.is_duplicate("BioquimicoService", _bio(toxin="42.00 ppm"))
+    assert not stage.is_duplicate("BioquimicoService", _bio(toxin="17.00 ppm"))
+
+
+def test_exact_confirmation_overrides_false_positive():
+    stage = DeduplicationStage(capacity=10, fp_rate=0.5, exact_confirm=True)
+    suppressed = sum(stage.is_duplicate("S", _bio(sample_id=f"bio_{i}")) for i in range(200))
+    assert suppressed == 0
+
+
+def test_records_without_sample_id_are_not_checked():
+    stage = DeduplicationStage()
+    vitals = {"subject_id": "subject_1", "vitals": {"heart_rate": 70, "spo2": "97%"}}
+    assert not stage.is_duplicate("FisicoService", vitals)
+    assert not stage.is_duplicate("FisicoService", dict(vitals))
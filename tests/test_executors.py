@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from processing.executors import FairShareScheduler, split_workers
+from processing.task_registry import INLINE, PROCESS, TaskRegistry, TaskSpec
+
+
+def _grant_order(weights, arrivals):
+
+    async def scenario():
+        scheduler = FairShareScheduler(slots=1, weights=weights)
+        await scheduler.acquire("blocker")
+        order = []
+
+        async def job(data_type):
+            await scheduler.acquire(data_type)
+            order.append(data_type)
+            scheduler.release(data_type)
+
+        tasks = [asyncio.create_task(job(data_type)) for data_type in arrivals]
+        await asyncio.sleep(0)
+        scheduler.release("blocker")
+        await asyncio.gather(*tasks)
+        return order
+
+    return asyncio.run(scenario())
+
+
+def test_burst_does_not_starve_other_type():
+    order = _grant_order({"genetic": 1.0, "biochemical": 1.0}, ["genetic"] * 6 + ["biochemical"] * 2)
+    assert order.index("biochemical") <= 2
+
+
+def test_weights_set_share_of_pool():
+    order = _grant_order({"genetic": 3.0, "biochemical": 1.0}, ["genetic"] * 8 + ["biochemical"] * 8)
+    assert order[:8].count("genetic") == 6
+
+
+def test_split_workers_keeps_one_per_pool():
+    assert split_workers(4, {"genetic": 1.0, "biochemical": 1.0}) == {"genetic": 2, "biochemical": 2}
+    assert split_workers(1, {"genetic": 3.0, "biochemical": 1.0})["biochemical"] == 1
+
+
+def test_registry_resolves_packed_variant_only_for_process_backend():
+    registry = TaskRegistry()
+    registry.register(TaskSpec("a", len, packed_func=bytes, degraded_func=str, backend=PROCESS))
+    registry.register(TaskSpec("b", len, packed_func=bytes, backend=INLINE))
+
+    assert registry.get("a").resolve() == (bytes, True)
+    assert registry.get("a").resolve(degraded=True) == (str, False)
+    assert registry.get("b").resolve() == (len, False)
+    assert registry.types(PROCESS) == ["a"]
+
+    with pytest.raises(ValueError):
+        registry.register(TaskSpec("c", len, backend="gpu"))
@@ -0,0 +1,28 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _loaded_after(module: str, candidates) -> set:
+
+    # Proceso limpio: en el de pytest ya está todo importado.
+    code = (
+        "import sys; sys.path[:0] = ['.', 'src']; "
+        f"import {module}; "
+        f"print(' '.join(m for m in {list(candidates)!r} if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return set(result.stdout.split())
+
+
+def test_cpu_worker_imports_stay_minimal():
+    assert _loaded_after("processing.cpu_tasks", ["asyncio", "pydantic", "numpy", "fastapi", "monitoring"]) == set()
+
+
+def test_headless_pipeline_does_not_load_web_stack():
+    pytest.importorskip("pydantic")
+    assert _loaded_after("main", ["fastapi", "uvicorn", "starlette", "pandas", "web"]) == set()
@@ -0,0 +1,57 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+
+from communication.records import PhysicalRecord
+from processing import io_tasks
+from processing.overload import OverloadController
+from processing.physical_lane import PhysicalLane, critical_vitals_mask
+from src.runtime_config import RuntimeSettings, runtime_config
+
+
+class FakeAlertManager:
+
+    def __init__(self):
+        self.alerts = []
+
+    async def send_alert(self, level, message, data):
+        self.alerts.append((level, data.subject_id))
+
+
+def test_mask_flags_out_of_range_and_ignores_missing():
+    limits = RuntimeSettings()
+    heart_rate = np.array([80, 200, 30, np.nan, 80], dtype=float)
+    spo2 = np.array([98, 98, 98, 98, np.nan], dtype=float)
+    spo2[0] = limits.spo2_min - 1
+    assert critical_vitals_mask(heart_rate, spo2, limits).tolist() == [True, True, True, False, False]
+
+
+def test_lane_persists_each_batch_with_one_call(monkeypatch):
+
+    calls = []
+    monkeypatch.setattr(io_tasks, "save_vitals_batch_sync", lambda records: calls.append(list(records)))
+    monkeypatch.setattr(runtime_config, "settings", RuntimeSettings(physical_batch_size=4))
+
+    async def scenario():
+        pools = SimpleNamespace(thread_executor=ThreadPoolExecutor(max_workers=1))
+        alert_manager = FakeAlertManager()
+        lane = PhysicalLane(pools, OverloadController(), alert_manager)
+        lane.start()
+
+        records = [PhysicalRecord(f"S{i % 2}", 80, 98) for i in range(8)]
+        records[1].heart_rate = 250
+        records[3].heart_rate = 250
+        for record in records:
+            lane.submit(record)
+        await lane.close()
+        pools.thread_executor.shutdown()
+        return records, alert_manager.alerts
+
+    records, alerts = asyncio.run(scenario())
+
+    assert [len(batch) for batch in calls] == [4, 4]
+    assert [r.critical for r in records] == [False, True, False, True, False, False, False, False]
+    # Dos lecturas críticas del mismo sujeto en un lote: una sola alerta.
+    assert alerts == [("CRITICAL", "S1")]
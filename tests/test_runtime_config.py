@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from communication.queue_types import ResizableQueue
+from src import config
+from src.runtime_config import RuntimeConfig
+
+
+def test_shrinking_queue_keeps_items_and_blocks_producers():
+
+    async def scenario():
+        queue = ResizableQueue(maxsize=5)
+        for i in range(5):
+            queue.put_nowait(i)
+        queue.resize(2)
+        assert queue.qsize() == 5 and queue.full()
+
+        producer = asyncio.create_task(queue.put(5))
+        await asyncio.sleep(0)
+        assert not producer.done()
+
+        queue.resize(10)
+        await asyncio.wait_for(producer, 1)
+        return [queue.get_nowait() for _ in range(queue.qsize())]
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 3, 4, 5]
+
+
+def test_update_applies_listeners_and_records_history():
+    runtime = RuntimeConfig()
+    seen = []
+
+    async def resize(value):
+        seen.append(value)
+
+    runtime.subscribe("max_io_workers", resize)
+    applied = asyncio.run(runtime.update({"max_io_workers": 3, "slo_latency_ms": {"physical": 500}}))
+
+    assert seen == [3]
+    assert applied["changes"]["max_io_workers"] == {"old": 10, "new": 3}
+    assert runtime.settings.slo_latency_ms["physical"] == 500.0
+    assert len(runtime.snapshot()["history"]) == 1
+
+
+@pytest.mark.parametrize("changes", [
+    {"max_cpu_workers": 0},
+    {"max_cpu_workers": True},
+    {"trace_sample_rate": 1.5},
+    {"slo_latency_ms": {"unknown": 10}},
+    {"not_a_setting": 1},
+])
+def test_invalid_changes_are_rejected(changes):
+    runtime = RuntimeConfig()
+    with pytest.raises(ValueError):
+        asyncio.run(runtime.update(changes))
+    assert not runtime.history
+
+
+def test_failed_listener_rolls_back_value():
+    runtime = RuntimeConfig()
+
+    def broken(value):
+        raise RuntimeError("no se pudo aplicar")
+
+    runtime.subscribe("max_cpu_workers", broken)
+    with pytest.raises(RuntimeError):
+        asyncio.run(runtime.update({"max_cpu_workers": 8}))
+    assert runtime.settings.max_cpu_workers == config.MAX_CPU_WORKERS
@@ -0,0 +1,73 @@
+import asyncio
+import os
+
+import pytest
+
+from communication.queue_types import SpillingQueue
+from communication.records import BiochemicalRecord, GeneticRecord
+from monitoring import TraceContext
+
+
+def _queue(tmp_path, maxsize=4, **kwargs):
+    return SpillingQueue(maxsize=maxsize, name="test", spill_dir=str(tmp_path), **kwargs)
+
+
+def test_overflow_spills_and_reads_back_in_order(tmp_path):
+
+    async def scenario():
+        queue = _queue(tmp_path)
+        for i in range(50):
+            await queue.put({"sample_id": f"bio_{i}"})
+        assert queue.qsize() == 50 and len(queue._queue) == 4 and queue.spilled_bytes > 0
+
+        out = [(await queue.get())["sample_id"] for _ in range(50)]
+        assert queue.empty() and queue.spilled_bytes == 0
+        return out
+
+    assert asyncio.run(scenario()) == [f"bio_{i}" for i in range(50)]
+
+
+def test_interleaved_puts_keep_fifo_order(tmp_path):
+    queue = _queue(tmp_path, maxsize=3)
+    produced, consumed = 0, []
+    for step in range(200):
+        for _ in range(step % 4):
+            queue.put_nowait(produced)
+            produced += 1
+        if not queue.empty():
+            consumed.append(queue.get_nowait())
+    while not queue.empty():
+        consumed.append(queue.get_nowait())
+    assert consumed == list(range(produced))
+
+
+def test_records_keep_trace_and_critical_flag(tmp_path):
+    queue = _queue(tmp_path, maxsize=1)
+    plain = BiochemicalRecord("bio_1", 12.0, 3.0, 1.0, 9.0)
+    critical = BiochemicalRecord("bio_2", 90.0, 3.0, 1.0, 9.0, critical=True)
+    traced = GeneticRecord("gen_1", "ACGT", trace=TraceContext(7, "genetic", "gen_1"))
+    for record in (plain, plain, critical, traced):
+        queue.put_nowait(record)
+
+    out = [queue.get_nowait() for _ in range(4)]
+    assert out[1] == plain
+    assert out[2].critical
+    assert out[3].trace.trace_id == 7
+
+
+def test_segment_is_truncated_once_drained(tmp_path):
+    queue = _queue(tmp_path, maxsize=1)
+    for i in range(10):
+        queue.put_nowait(i)
+    while not queue.empty():
+        queue.get_nowait()
+    assert os.path.getsize(queue.spill_path) == 0
+
+
+def test_disk_cap_restores_backpressure(tmp_path):
+    queue = _queue(tmp_path, maxsize=1, max_spill_bytes=64)
+    queue.put_nowait("en memoria")
+    while not queue.full():
+        queue.put_nowait("x" * 16)
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait("y")